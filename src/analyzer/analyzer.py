@@ -1,15 +1,15 @@
-from pathlib import Path
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 import os
-from .llm import LLMAnalyzer
 from crawler.fetcher import DataFetcher
 from crawler.process import read_all_today_titles, load_frequency_words, detect_latest_new_titles, save_titles_to_file
-from push.sender import generate_html_report, send_to_notifications
 from utils import CONFIG, VERSION, check_version_update, get_beijing_time, ensure_directory_exists
 from utils.config import MODE_STRATEGIES_CONFIG
 from utils.statistics import count_word_frequency
-from models import AnalysisData
+from models import AnalysisData, ModeStrategy
 from typing import Dict, List, Tuple, Optional
+import logging
+
+logger = logging.getLogger("trendradar")
 
 # === 主分析器 ===
 class NewsAnalyzer:
@@ -22,17 +22,56 @@ class NewsAnalyzer:
         self.request_interval = CONFIG.REQUEST_INTERVAL
         self.report_mode = CONFIG.REPORT_MODE
         self.rank_threshold = CONFIG.RANK_THRESHOLD
+        self.enable_crawler = bool(CONFIG["ENABLE_CRAWLER"])
+        self.only_crawler = bool(CONFIG["ONLY_CRAWLER"])
+        self.enable_notification = bool(CONFIG["ENABLE_NOTIFICATION"])
+        self.show_version_update = bool(CONFIG["SHOW_VERSION_UPDATE"])
+        self.platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+        # crawl_websites 的入参形态：有名称的平台用 (id, name) 元组，否则只用 id
+        self.platform_crawl_ids = [
+            (platform["id"], platform["name"]) if "name" in platform else platform["id"]
+            for platform in CONFIG["PLATFORMS"]
+        ]
+        self.platform_display_names = [
+            platform.get("name", platform["id"]) for platform in CONFIG["PLATFORMS"]
+        ]
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
         self.update_info = None
         self.proxy_url: str | None = None
+
+        # 这两项在一次运行中不会变化，启动时计算一次，避免每次推送判断都重查 CONFIG
+        self._mode_strategy = self.MODE_STRATEGIES.get(
+            self.report_mode, self.MODE_STRATEGIES["daily"]
+        )
+        self._has_notification = bool(
+            CONFIG["FEISHU_WEBHOOK_URL"]
+            or CONFIG["DINGTALK_WEBHOOK_URL"]
+            or CONFIG["WEWORK_WEBHOOK_URL"]
+            or (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"])
+            or (CONFIG["EMAIL_FROM"] and CONFIG["EMAIL_PASSWORD"] and CONFIG["EMAIL_TO"])
+            or (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"])
+            or CONFIG["BARK_URL"]
+        )
+
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
-        self.llm_analyzer = LLMAnalyzer() if CONFIG.LLM_KEY else None
+        # 延迟导入：LLMAnalyzer 会拉起 openai/httpx，未配置 LLM 时不付出导入成本
+        if CONFIG.LLM_KEY:
+            from .llm import LLMAnalyzer
+
+            self.llm_analyzer = LLMAnalyzer(self.proxy_url)
+        else:
+            self.llm_analyzer = None
 
         # 统一的分析数据缓存
         self.analysis_data: Optional[AnalysisData] = None
 
+        # 单次 run() 内的数据加载缓存，避免重复读盘解析
+        self._analysis_data_cache: Optional[Tuple] = None
+        self._freq_cache: Optional[Tuple[List, List]] = None
+        self._new_titles_cache: Optional[Dict] = None
+
         if self.is_github_actions:
             self._check_version_update()
 
@@ -57,17 +96,20 @@ class NewsAnalyzer:
         """设置代理配置"""
         if not self.is_github_actions and CONFIG.USE_PROXY:
             self.proxy_url = CONFIG.DEFAULT_PROXY
-            print("本地环境，使用代理")
+            logger.info("本地环境，使用代理")
         elif not self.is_github_actions and not CONFIG.USE_PROXY:
-            print("本地环境，未启用代理")
+            logger.info("本地环境，未启用代理")
         else:
-            print("GitHub Actions环境，不使用代理")
+            logger.info("GitHub Actions环境，不使用代理")
 
     def _check_version_update(self) -> None:
         """检查版本更新"""
         try:
             need_update, remote_version = check_version_update(
-                VERSION, CONFIG.VERSION_CHECK_URL, self.proxy_url
+                VERSION,
+                CONFIG.VERSION_CHECK_URL,
+                self.proxy_url,
+                session=self.data_fetcher.session,
             )
 
             if need_update and remote_version:
@@ -75,76 +117,75 @@ class NewsAnalyzer:
                     "current_version": VERSION,
                     "remote_version": remote_version,
                 }
-                print(f"发现新版本: {remote_version} (当前: {VERSION})")
+                logger.info("发现新版本: %s (当前: %s)", remote_version, VERSION)
             else:
-                print("版本检查完成，当前为最新版本")
+                logger.info("版本检查完成，当前为最新版本")
         except Exception as e:
-            print(f"版本检查出错: {e}")
+            logger.info("版本检查出错: %s", e)
 
-    def _get_mode_strategy(self) -> Dict:
-        """获取当前模式的策略配置"""
-        return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
+    def _get_mode_strategy(self) -> ModeStrategy:
+        """获取当前模式的策略配置（启动时已缓存）"""
+        return self._mode_strategy
 
     def _has_notification_configured(self) -> bool:
-        """检查是否配置了任何通知渠道"""
-        return any(
-            [
-                CONFIG["FEISHU_WEBHOOK_URL"],
-                CONFIG["DINGTALK_WEBHOOK_URL"],
-                CONFIG["WEWORK_WEBHOOK_URL"],
-                (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]),
-                (
-                    CONFIG["EMAIL_FROM"]
-                    and CONFIG["EMAIL_PASSWORD"]
-                    and CONFIG["EMAIL_TO"]
-                ),
-                (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"]),
-                CONFIG["BARK_URL"],
-            ]
-        )
+        """检查是否配置了任何通知渠道（启动时已缓存）"""
+        return self._has_notification
 
     def _has_valid_content(
         self, stats: List[Dict], new_titles: Optional[Dict] = None
     ) -> bool:
         """检查是否有有效的新闻内容"""
+        # 只要stats有匹配的新闻就说明有有效内容（所有模式通用，找到即返回）
+        for stat in stats:
+            if stat["count"] > 0:
+                return True
+
         if self.report_mode in ["incremental", "current"]:
-            # 增量模式和current模式下，只要stats有内容就说明有匹配的新闻
-            return any(stat["count"] > 0 for stat in stats)
-        else:
-            # 当日汇总模式下，检查是否有匹配的频率词新闻或新增新闻
-            has_matched_news = any(stat["count"] > 0 for stat in stats)
-            has_new_news = bool(
-                new_titles and any(len(titles) > 0 for titles in new_titles.values())
-            )
-            return has_matched_news or has_new_news
+            return False
+
+        # 当日汇总模式下，新增新闻同样算有效内容
+        return bool(new_titles) and any(new_titles.values())
+
+    def _load_frequency_words_cached(self) -> Tuple[List, List]:
+        """加载频率词配置，单次 run() 内只读盘解析一次"""
+        if self._freq_cache is None:
+            self._freq_cache = load_frequency_words()
+        return self._freq_cache
+
+    def _detect_new_titles_cached(self) -> Dict:
+        """检测最新批次新增标题，单次 run() 内只扫描解析一次"""
+        if self._new_titles_cache is None:
+            self._new_titles_cache = detect_latest_new_titles(self.platform_ids)
+        return self._new_titles_cache
 
     def _load_analysis_data(
         self,
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
         """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+        if self._analysis_data_cache is not None:
+            return self._analysis_data_cache
+
         try:
-            # 获取当前配置的监控平台ID列表
-            current_platform_ids = []
-            for platform in CONFIG["PLATFORMS"]:
-                current_platform_ids.append(platform["id"])
+            # 当前配置的监控平台ID列表（启动时已缓存）
+            current_platform_ids = self.platform_ids
 
-            print(f"当前监控平台: {current_platform_ids}")
+            logger.info("当前监控平台: %s", current_platform_ids)
 
             all_results, id_to_name, title_info = read_all_today_titles(
                 current_platform_ids
             )
 
             if not all_results:
-                print("没有找到当天的数据")
+                logger.info("没有找到当天的数据")
                 return None
 
-            total_titles = sum(len(titles) for titles in all_results.values())
-            print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
+            total_titles = sum(map(len, all_results.values()))
+            logger.info("读取到 %s 个标题（已按当前监控平台过滤）", total_titles)
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
-            word_groups, filter_words = load_frequency_words()
+            new_titles = self._detect_new_titles_cached()
+            word_groups, filter_words = self._load_frequency_words_cached()
 
-            return (
+            self._analysis_data_cache = (
                 all_results,
                 id_to_name,
                 title_info,
@@ -152,29 +193,28 @@ class NewsAnalyzer:
                 word_groups,
                 filter_words,
             )
+            return self._analysis_data_cache
         except Exception as e:
-            print(f"数据加载失败: {e}")
+            logger.info("数据加载失败: %s", e)
             return None
 
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """从当前抓取结果构建标题信息"""
-        title_info = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
+        # 字典推导在 C 级执行循环；first_time/last_time/count 对当前批次是常量
+        return {
+            source_id: {
+                title: {
                     "first_time": time_info,
                     "last_time": time_info,
                     "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
+                    "ranks": title_data.get("ranks", []),
+                    "url": title_data.get("url", ""),
+                    "mobileUrl": title_data.get("mobileUrl", ""),
                 }
-        return title_info
+                for title, title_data in titles_data.items()
+            }
+            for source_id, titles_data in results.items()
+        }
 
     def _run_analysis_pipeline(
         self,
@@ -208,6 +248,9 @@ class NewsAnalyzer:
             mode=mode,
         )
 
+        # 延迟导入：push.sender 只在真正需要渲染/推送时加载
+        from push.sender import generate_html_report
+
         # HTML生成
         html_file = generate_html_report(
             stats,
@@ -217,7 +260,7 @@ class NewsAnalyzer:
             id_to_name=id_to_name,
             mode=mode,
             is_daily_summary=is_daily_summary,
-            update_info=self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
+            update_info=self.update_info if self.show_version_update else None,
         )
 
         return stats, html_file
@@ -234,12 +277,11 @@ class NewsAnalyzer:
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
         has_notification = self._has_notification_configured()
+        has_valid_content = self._has_valid_content(stats, new_titles)
+
+        if self.enable_notification and has_notification and has_valid_content:
+            from push.sender import send_to_notifications
 
-        if (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_notification
-            and self._has_valid_content(stats, new_titles)
-        ):
             send_to_notifications(
                 stats,
                 failed_ids or [],
@@ -252,23 +294,21 @@ class NewsAnalyzer:
                 html_file_path=html_file_path,
             )
             return True
-        elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
-            print("⚠️ 警告：通知功能已启用但未配置任何通知渠道，将跳过通知发送")
-        elif not CONFIG["ENABLE_NOTIFICATION"]:
-            print(f"跳过{report_type}通知：通知功能已禁用")
-        elif (
-            CONFIG["ENABLE_NOTIFICATION"]
-            and has_notification
-            and not self._has_valid_content(stats, new_titles)
-        ):
+        elif self.enable_notification and not has_notification:
+            logger.info("⚠️ 警告：通知功能已启用但未配置任何通知渠道，将跳过通知发送")
+        elif not self.enable_notification:
+            logger.info("跳过%s通知：通知功能已禁用", report_type)
+        elif self.enable_notification and has_notification and not has_valid_content:
             mode_strategy = self._get_mode_strategy()
             if "实时" in report_type:
-                print(
-                    f"跳过实时推送通知：{mode_strategy['mode_name']}下未检测到匹配的新闻"
+                logger.info(
+                    "跳过实时推送通知：%s下未检测到匹配的新闻",
+                    mode_strategy.mode_name,
                 )
             else:
-                print(
-                    f"跳过{mode_strategy['summary_report_type']}通知：未匹配到有效的新闻内容"
+                logger.info(
+                    "跳过%s通知：未匹配到有效的新闻内容",
+                    mode_strategy.summary_report_type,
                 )
 
         return False
@@ -277,38 +317,31 @@ class NewsAnalyzer:
     def _initialize_and_check_config(self) -> None:
         """通用初始化和配置检查"""
         now = get_beijing_time()
-        print(f"当前北京时间: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("当前北京时间: %s", now.strftime('%Y-%m-%d %H:%M:%S'))
 
-        if not CONFIG["ENABLE_CRAWLER"]:
-            print("爬虫功能已禁用（ENABLE_CRAWLER=False），将使用历史数据生成分析报告")
-        elif CONFIG["ONLY_CRAWLER"]:
-            print("仅爬取模式已启用（ONLY_CRAWLER=True），将只执行数据爬取，跳过分析和推送")
+        if not self.enable_crawler:
+            logger.info("爬虫功能已禁用（ENABLE_CRAWLER=False），将使用历史数据生成分析报告")
+        elif self.only_crawler:
+            logger.info("仅爬取模式已启用（ONLY_CRAWLER=True），将只执行数据爬取，跳过分析和推送")
 
         has_notification = self._has_notification_configured()
-        if not CONFIG["ENABLE_NOTIFICATION"]:
-            print("通知功能已禁用（ENABLE_NOTIFICATION=False），将只进行数据抓取")
+        if not self.enable_notification:
+            logger.info("通知功能已禁用（ENABLE_NOTIFICATION=False），将只进行数据抓取")
         elif not has_notification:
-            print("未配置任何通知渠道，将只进行数据抓取，不发送通知")
+            logger.info("未配置任何通知渠道，将只进行数据抓取，不发送通知")
         else:
-            print("通知功能已启用，将发送通知")
+            logger.info("通知功能已启用，将发送通知")
 
         mode_strategy = self._get_mode_strategy()
-        print(f"报告模式: {self.report_mode}")
-        print(f"运行模式: {mode_strategy['description']}")
+        logger.info("报告模式: %s", self.report_mode)
+        logger.info("运行模式: %s", mode_strategy.description)
 
     def _crawl_data(self) -> Tuple[Dict, Dict, List, str]:
         """执行数据爬取"""
-        ids = []
-        for platform in CONFIG["PLATFORMS"]:
-            if "name" in platform:
-                ids.append((platform["id"], platform["name"]))
-            else:
-                ids.append(platform["id"])
+        ids = self.platform_crawl_ids
 
-        print(
-            f"配置的监控平台: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
-        )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        logger.info("配置的监控平台: %s", self.platform_display_names)
+        logger.info("开始爬取数据，请求间隔 %s 毫秒", self.request_interval)
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
@@ -317,7 +350,7 @@ class NewsAnalyzer:
 
         # 保存标题到文件
         title_file = save_titles_to_file(results, id_to_name, failed_ids)
-        print(f"标题已保存到: {title_file}")
+        logger.info("标题已保存到: %s", title_file)
 
         return results, id_to_name, failed_ids, title_file
 
@@ -327,18 +360,24 @@ class NewsAnalyzer:
             return self.analysis_data
 
         # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-        print(f"当前监控平台: {current_platform_ids}")
-
-        # 加载基础配置数据（这些数据在整个分析过程中不会改变）
-        word_groups, filter_words = load_frequency_words()
-        new_titles = detect_latest_new_titles(current_platform_ids)
+        current_platform_ids = self.platform_ids
+        logger.info("当前监控平台: %s", current_platform_ids)
 
         # 根据是否启用爬虫来准备数据
-        if CONFIG["ENABLE_CRAWLER"]:
-            # 启用爬虫：使用当前爬取的数据
-            results, id_to_name, failed_ids, title_file = self._crawl_data()
-            time_info = Path(title_file).stem
+        if self.enable_crawler:
+            # 启用爬虫：爬取是网络瓶颈，新增检测和频率词加载是相互独立的磁盘IO，
+            # 放到后台线程与爬取重叠。爬取结果落盘发生在所有请求完成之后，
+            # 新增检测扫描到的仍是爬取前的文件集，语义与串行版本一致
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                new_titles_future = executor.submit(self._detect_new_titles_cached)
+                freq_words_future = executor.submit(self._load_frequency_words_cached)
+
+                results, id_to_name, failed_ids, title_file = self._crawl_data()
+
+                new_titles = new_titles_future.result()
+                word_groups, filter_words = freq_words_future.result()
+
+            time_info = os.path.splitext(os.path.basename(title_file))[0]
 
             # 准备当前数据的标题信息
             current_title_info = self._prepare_current_title_info(results, time_info)
@@ -352,6 +391,9 @@ class NewsAnalyzer:
 
         else:
             # 禁用爬虫：使用历史数据
+            word_groups, filter_words = self._load_frequency_words_cached()
+            new_titles = self._detect_new_titles_cached()
+
             historical_data = self._load_analysis_data()
             if not historical_data:
                 raise RuntimeError("无法加载历史数据进行分析")
@@ -387,73 +429,37 @@ class NewsAnalyzer:
 
 
 
-    # === 新的方法结构：分析方法（按模式拆分） ===
-    def _analyze_current_mode(self) -> Tuple[List[Dict], str]:
-        """current模式分析：使用完整历史数据"""
-        data = self.analysis_data
-        if not data or not data.all_results:
-            raise RuntimeError("current模式需要历史数据，但无法加载历史数据")
-
-        print(f"current模式：使用过滤后的历史数据，包含平台：{list(data.all_results.keys())}")
-
-        stats, html_file = self._run_analysis_pipeline(
-            data.all_results,
-            self.report_mode,
-            data.title_info,
-            data.historical_id_to_name,
-        )
-
-        return stats, html_file
-
-    def _analyze_incremental_mode(self) -> Tuple[List[Dict], str]:
-        """incremental模式分析：使用当前数据"""
-        data = self.analysis_data
-        if not data:
-            raise RuntimeError("analysis_data 未初始化")
-
-        stats, html_file = self._run_analysis_pipeline(
-            data.results,
-            self.report_mode,
-            data.current_title_info,
-            data.id_to_name,
-        )
-
-        return stats, html_file
-
-    def _analyze_daily_mode(self) -> Tuple[List[Dict], str]:
-        """daily模式分析：使用当前数据"""
+    # === 新的方法结构：分析方法 ===
+    def _analyze(self) -> Tuple[List[Dict], str]:
+        """按当前报告模式执行分析：current模式使用完整历史数据，其余模式使用当前数据"""
         data = self.analysis_data
         if not data:
             raise RuntimeError("analysis_data 未初始化")
 
-        stats, html_file = self._run_analysis_pipeline(
-            data.results,
-            self.report_mode,
-            data.current_title_info,
-            data.id_to_name,
-        )
+        if self.report_mode == "current":
+            if not data.all_results:
+                raise RuntimeError("current模式需要历史数据，但无法加载历史数据")
 
-        return stats, html_file
+            logger.info("current模式：使用过滤后的历史数据，包含平台：%s", list(data.all_results.keys()))
 
-    def _analyze_llm_mode(self) -> Tuple[List[Dict], str]:
-        """llm_analysis模式分析：使用当前数据"""
-        data = self.analysis_data
-        if not data:
-            raise RuntimeError("analysis_data 未初始化")
+            return self._run_analysis_pipeline(
+                data.all_results,
+                self.report_mode,
+                data.title_info,
+                data.historical_id_to_name,
+            )
 
-        stats, html_file = self._run_analysis_pipeline(
+        return self._run_analysis_pipeline(
             data.results,
             self.report_mode,
             data.current_title_info,
             data.id_to_name,
         )
 
-        return stats, html_file
-
     # === 新的方法结构：推送方法 ===
     def _send_realtime_notification(self, stats: List[Dict], html_file: str, mode_strategy: Dict) -> None:
         """发送实时通知"""
-        if not mode_strategy["should_send_realtime"]:
+        if not mode_strategy.should_send_realtime:
             return
 
         data = self.analysis_data
@@ -466,7 +472,7 @@ class NewsAnalyzer:
             combined_id_to_name = {**data.historical_id_to_name, **data.id_to_name}
             self._send_notification_if_needed(
                 stats,
-                mode_strategy["realtime_report_type"],
+                mode_strategy.realtime_report_type,
                 self.report_mode,
                 failed_ids=data.failed_ids,
                 new_titles=data.new_titles,
@@ -476,7 +482,7 @@ class NewsAnalyzer:
         else:
             self._send_notification_if_needed(
                 stats,
-                mode_strategy["realtime_report_type"],
+                mode_strategy.realtime_report_type,
                 self.report_mode,
                 failed_ids=data.failed_ids,
                 new_titles=data.new_titles,
@@ -486,12 +492,24 @@ class NewsAnalyzer:
 
     def _generate_and_send_summary(self, mode_strategy: Dict, should_send_realtime: bool) -> Optional[str]:
         """生成汇总报告并发送通知"""
-        if not mode_strategy["should_generate_summary"]:
+        if not mode_strategy.should_generate_summary:
+            return None
+
+        # 没有任何消费方时跳过汇总：不会发通知、不会打开浏览器、也没有环境持久化产物。
+        # GitHub Actions 会把汇总HTML（含根目录 index.html，即 Pages 网页版）提交回仓库，
+        # Docker 的产物保留在挂载卷中，两者都必须照常生成
+        if (
+            not (self.enable_notification and self._has_notification)
+            and not self._should_open_browser()
+            and not self.is_docker_container
+            and not self.is_github_actions
+        ):
+            logger.info("跳过汇总报告生成：通知未启用且无人查看报告")
             return None
 
         if should_send_realtime:
             # 如果已经发送了实时通知，汇总只生成HTML不发送通知
-            return self._generate_summary_html_with_data(mode_strategy["summary_mode"])
+            return self._generate_summary_html_with_data(mode_strategy.summary_mode)
         else:
             # daily模式等：直接生成汇总报告并发送通知
             return self._generate_summary_report_with_data(mode_strategy)
@@ -503,26 +521,26 @@ class NewsAnalyzer:
             raise RuntimeError("analysis_data 未初始化")
 
         summary_type = (
-            "当前榜单汇总" if mode_strategy["summary_mode"] == "current" else "当日汇总"
+            "当前榜单汇总" if mode_strategy.summary_mode == "current" else "当日汇总"
         )
-        print(f"生成{summary_type}报告...")
+        logger.info("生成%s报告...", summary_type)
 
         # 运行分析流水线
         stats, html_file = self._run_analysis_pipeline(
             data.all_results,
-            mode_strategy["summary_mode"],
+            mode_strategy.summary_mode,
             data.title_info,
             data.historical_id_to_name,
             is_daily_summary=True,
         )
 
-        print(f"{summary_type}报告已生成: {html_file}")
+        logger.info("%s报告已生成: %s", summary_type, html_file)
 
         # 发送通知
         self._send_notification_if_needed(
             stats,
-            mode_strategy["summary_report_type"],
-            mode_strategy["summary_mode"],
+            mode_strategy.summary_report_type,
+            mode_strategy.summary_mode,
             failed_ids=[],
             new_titles=data.new_titles,
             id_to_name=data.historical_id_to_name,
@@ -538,7 +556,7 @@ class NewsAnalyzer:
             raise RuntimeError("analysis_data 未初始化")
 
         summary_type = "当前榜单汇总" if mode == "current" else "当日汇总"
-        print(f"生成{summary_type}HTML...")
+        logger.info("生成%sHTML...", summary_type)
 
         # 运行分析流水线
         _, html_file = self._run_analysis_pipeline(
@@ -549,7 +567,7 @@ class NewsAnalyzer:
             is_daily_summary=True,
         )
 
-        print(f"{summary_type}HTML已生成: {html_file}")
+        logger.info("%sHTML已生成: %s", summary_type, html_file)
         return html_file
 
     def _open_report_in_browser(self, html_file: str, summary_html: Optional[str]) -> None:
@@ -557,23 +575,30 @@ class NewsAnalyzer:
         if not self._should_open_browser() or not html_file:
             if self.is_docker_container and html_file:
                 if summary_html:
-                    print(f"汇总报告已生成（Docker环境）: {summary_html}")
+                    logger.info("汇总报告已生成（Docker环境）: %s", summary_html)
                 else:
-                    print(f"HTML报告已生成（Docker环境）: {html_file}")
+                    logger.info("HTML报告已生成（Docker环境）: %s", html_file)
             return
 
+        import webbrowser
+
         if summary_html:
-            summary_url = "file://" + str(Path(summary_html).resolve())
-            print(f"正在打开汇总报告: {summary_url}")
+            summary_url = "file://" + os.path.abspath(summary_html)
+            logger.info("正在打开汇总报告: %s", summary_url)
             webbrowser.open(summary_url)
         else:
-            file_url = "file://" + str(Path(html_file).resolve())
-            print(f"正在打开HTML报告: {file_url}")
+            file_url = "file://" + os.path.abspath(html_file)
+            logger.info("正在打开HTML报告: %s", file_url)
             webbrowser.open(file_url)
 
     def run(self) -> None:
         """执行分析流程"""
         try:
+            # 清空单次运行的数据缓存，保证重复调用 run() 时读取到最新数据
+            self._analysis_data_cache = None
+            self._freq_cache = None
+            self._new_titles_cache = None
+
             # 1. 初始化和配置读取
             self._initialize_and_check_config()
             mode_strategy = self._get_mode_strategy()
@@ -582,34 +607,24 @@ class NewsAnalyzer:
             data = self._prepare_unified_analysis_data()
 
             # 检查是否仅执行爬取功能
-            if CONFIG["ONLY_CRAWLER"]:
+            if self.only_crawler:
                 return
 
             # 3. 根据当前的模式策略，执行对应的分析逻辑
-            if self.report_mode == "current":
-                stats, html_file = self._analyze_current_mode()
-            elif self.report_mode == "incremental":
-                stats, html_file = self._analyze_incremental_mode()
-            elif self.report_mode == "daily":
-                stats, html_file = self._analyze_daily_mode()
-            elif self.report_mode == "llm_analysis":
-                stats, html_file = self._analyze_llm_mode()
-            else:
-                # 默认使用daily模式
-                stats, html_file = self._analyze_daily_mode()
+            stats, html_file = self._analyze()
 
-            print(f"HTML报告已生成: {html_file}")
+            logger.info("HTML报告已生成: %s", html_file)
 
             # 4. 推送阶段：发送通知和生成汇总
             # 发送实时通知
             self._send_realtime_notification(stats, html_file, mode_strategy)
 
             # 生成汇总报告并发送通知
-            summary_html = self._generate_and_send_summary(mode_strategy, mode_strategy["should_send_realtime"])
+            summary_html = self._generate_and_send_summary(mode_strategy, mode_strategy.should_send_realtime)
 
             # 在浏览器中打开报告
             self._open_report_in_browser(html_file, summary_html)
 
         except Exception as e:
-            print(f"分析流程执行出错: {e}")
+            logger.info("分析流程执行出错: %s", e)
             raise
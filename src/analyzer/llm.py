@@ -1,31 +1,114 @@
 from typing import List, Optional, Dict, Tuple
 from openai import OpenAI
+import httpx
 from utils import CONFIG
 from utils.formatter import format_time_display
 from json_repair import repair_json
 from pathlib import Path
+import gzip
+import hashlib
+import time
 from push.sender import generate_html_report
 from crawler.process import read_all_today_titles
 from models.llm_models import NewsGroup, NewsTitle
+from pydantic import TypeAdapter
 import os
 import re
-import json
+import orjson
 
 
 # === 大模型分析 ===
 
+# LLM 响应里的 ```json ... ``` 代码块，只需第一个匹配
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)\n\s*```", re.DOTALL)
+
+# 整表校验：一次进入 pydantic-core 校验整个分组列表，而不是逐项构造模型。
+# NewsTitle/NewsGroup 本身是 dataclass，逐步过滤时的单项校验也走 TypeAdapter
+_NEWS_GROUPS_ADAPTER = TypeAdapter(List[NewsGroup])
+_NEWS_TITLE_ADAPTER = TypeAdapter(NewsTitle)
+_NEWS_GROUP_ADAPTER = TypeAdapter(NewsGroup)
+
 
 class LLMAnalyzer:
     client: OpenAI
     system_prompt: str
 
-    def __init__(self) -> None:
+    def __init__(self, proxy_url: Optional[str] = None) -> None:
+        # 显式配置带 keep-alive 连接池的 HTTP 客户端，多次分析调用复用 TCP/TLS 连接
+        http_client_kwargs = {
+            "limits": httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            "timeout": httpx.Timeout(60.0, connect=5.0),
+        }
+        if proxy_url:
+            http_client_kwargs["proxy"] = proxy_url
+
         self.client = OpenAI(
             api_key=CONFIG["LLM_KEY"],
             base_url=CONFIG["LLM_URL"],
+            http_client=httpx.Client(**http_client_kwargs),
         )
         self.system_prompt = self._load_llm_system_prompt()
 
+        # 预构建平台查找表：source 名称/id -> platform_id、platform_id -> 显示名称
+        self._source_to_pid: Dict[str, str] = {}
+        self._pid_to_name: Dict[str, str] = {}
+        for platform in CONFIG["PLATFORMS"]:
+            platform_id = platform["id"]
+            self._source_to_pid[platform_id] = platform_id
+            if platform.get("name"):
+                self._source_to_pid[platform["name"]] = platform_id
+            self._pid_to_name[platform_id] = platform.get("name", platform_id)
+
+        # LLM 响应的磁盘缓存：同一提示词在 TTL 内命中缓存，省掉整次网络调用
+        self.cache_dir = Path("output") / ".llm_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = CONFIG.get("LLM_CACHE_TTL", 3600)
+        self.cleanup_expired_cache()
+
+    def cleanup_expired_cache(self) -> None:
+        """清理过期的缓存响应。
+
+        缓存键包含当天的标题内容，跨运行基本不会重复命中，
+        只在同键读取时删除会让过期文件无限累积，必须启动时统一清扫。
+        """
+        now = time.time()
+        for cache_file in self.cache_dir.glob("*.txt.gz"):
+            try:
+                if now - cache_file.stat().st_mtime > self.cache_ttl:
+                    cache_file.unlink()
+            except OSError as e:
+                print(f"清理过期 LLM 缓存失败 {cache_file.name}: {e}")
+
+    def _cache_file_for(self, user_content: str) -> Path:
+        """根据系统提示词+用户内容计算缓存文件路径"""
+        key = hashlib.sha256(
+            (self.system_prompt + user_content).encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}.txt.gz"
+
+    def _load_cached_response(self, cache_file: Path) -> Optional[str]:
+        """读取未过期的缓存响应，没有命中返回 None"""
+        try:
+            if not cache_file.exists():
+                return None
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                cache_file.unlink()
+                return None
+            # 响应是高冗余文本，gzip 存储可减少数倍磁盘读写量
+            with gzip.open(cache_file, "rt", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            print(f"读取 LLM 缓存失败: {e}")
+            return None
+
+    def _save_cached_response(self, cache_file: Path, llm_summary: str) -> None:
+        """写入缓存响应"""
+        try:
+            with gzip.open(cache_file, "wt", encoding="utf-8") as f:
+                f.write(llm_summary)
+        except Exception as e:
+            print(f"保存 LLM 缓存失败: {e}")
+
     def _load_llm_system_prompt(self) -> str:
         """加载大模型系统提示词"""
         prompt_file = os.environ.get(
@@ -47,20 +130,32 @@ class LLMAnalyzer:
     ) -> Optional[List[NewsGroup]]:
         """从 LLM 响应中提取 JSON 并进行类型验证，支持逐步过滤机制"""
         try:
-            # 使用正则表达式提取 JSON 内容
-            json_pattern = r"```json\s*\n(.*?)\n\s*```"
-            matches = re.findall(json_pattern, llm_response, re.DOTALL)
-
-            if not matches:
-                # 如果没有找到代码块，尝试直接解析整个响应
-                json_content = llm_response.strip()
-            else:
-                json_content = matches[0].strip()
+            # 先用 C 级 str.find 定位第一个代码块（绝大多数响应都是规整的），
+            # 定位失败再退回正则匹配
+            json_content = None
+            fence_start = llm_response.find("```json")
+            if fence_start != -1:
+                body_start = llm_response.find("\n", fence_start + 7)
+                if (
+                    body_start != -1
+                    and not llm_response[fence_start + 7 : body_start].strip()
+                ):
+                    fence_end = llm_response.find("```", body_start + 1)
+                    if fence_end != -1:
+                        json_content = llm_response[body_start + 1 : fence_end].strip()
+
+            if json_content is None:
+                match = _JSON_BLOCK_RE.search(llm_response)
+                if match is None:
+                    # 如果没有找到代码块，尝试直接解析整个响应
+                    json_content = llm_response.strip()
+                else:
+                    json_content = match.group(1).strip()
 
-            # 解析 JSON
+            # 解析 JSON（orjson 为 C 实现，格式正确的响应无需走修复流程）
             try:
-                data = json.loads(json_content)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(json_content)
+            except orjson.JSONDecodeError as e:
                 print(f"JSON 解析失败: {e}")
                 print(f"原始内容: {json_content}")
 
@@ -70,7 +165,7 @@ class LLMAnalyzer:
                     try:
                         repaired_json = repair_json(json_content)
                         print(f"修复后的 JSON: {repaired_json}")
-                        data = json.loads(repaired_json)
+                        data = orjson.loads(repaired_json)
                         print("JSON 修复成功")
                     except Exception as repair_error:
                         print(f"JSON 修复失败: {repair_error}")
@@ -85,7 +180,7 @@ class LLMAnalyzer:
 
             # 第一步：尝试直接验证所有数据
             try:
-                news_groups = [NewsGroup(**group) for group in data]
+                news_groups = _NEWS_GROUPS_ADAPTER.validate_python(data)
                 print(f"LLM JSON 验证成功，共 {len(news_groups)} 个新闻分组")
                 return self._check_data_quality(news_groups)
             except Exception as e:
@@ -104,8 +199,8 @@ class LLMAnalyzer:
 
                 for news_title_data in news_titles:
                     try:
-                        # 尝试创建 NewsTitle 对象
-                        NewsTitle(**news_title_data)
+                        # 尝试校验 NewsTitle 数据
+                        _NEWS_TITLE_ADAPTER.validate_python(news_title_data)
                         filtered_news_titles.append(news_title_data)
                     except Exception as e:
                         print(f"过滤掉无效的 NewsTitle: {news_title_data}, 错误: {e}")
@@ -122,7 +217,7 @@ class LLMAnalyzer:
 
             # 尝试验证过滤后的数据
             try:
-                news_groups = [NewsGroup(**group) for group in filtered_groups_data]
+                news_groups = _NEWS_GROUPS_ADAPTER.validate_python(filtered_groups_data)
                 print(f"过滤 NewsTitle 后验证成功，共 {len(news_groups)} 个新闻分组")
                 return self._check_data_quality(news_groups)
             except Exception as e:
@@ -133,7 +228,7 @@ class LLMAnalyzer:
             valid_groups = []
             for group_data in filtered_groups_data:
                 try:
-                    group = NewsGroup(**group_data)
+                    group = _NEWS_GROUP_ADAPTER.validate_python(group_data)
                     valid_groups.append(group)
                 except Exception as e:
                     print(f"过滤掉无效的 NewsGroup: {group_data.get('keywords', 'unknown')}, 错误: {e}")
@@ -174,7 +269,7 @@ class LLMAnalyzer:
         if not news_title:
             return ""
 
-        content = "> 以下是新闻来源及相应的热榜内容和热榜排名\n\n"
+        parts = ["> 以下是新闻来源及相应的热榜内容和热榜排名\n\n"]
 
         for source_data in news_title:
             platform_name = source_data.get("platform", "未知来源")
@@ -183,14 +278,14 @@ class LLMAnalyzer:
             if not articles:
                 continue
 
-            content += f"## {platform_name}\n\n"
+            parts.append(f"## {platform_name}\n\n")
 
             for idx, article in enumerate(articles, 1):
-                content += f"{idx}. {article}\n"
+                parts.append(f"{idx}. {article}\n")
 
-            content += "\n"
+            parts.append("\n")
 
-        return content.rstrip()
+        return "".join(parts).rstrip()
 
     def _convert_llm_groups_to_stats(
         self, validated_groups: List[NewsGroup], deduplicated_data_source: Dict, title_info: Dict
@@ -199,6 +294,9 @@ class LLMAnalyzer:
         stats = []
         total_titles = sum(len(group.news_title) for group in validated_groups)
 
+        # 循环不变量提前绑定一次
+        rank_threshold = CONFIG["RANK_THRESHOLD"]
+
         for group in validated_groups:
             # 构建关键词字符串
             keywords_str = " ".join(group.keywords)
@@ -211,23 +309,32 @@ class LLMAnalyzer:
 
                 # 从title_info中查找对应的新闻详细信息（可选，用于获取时间等额外信息）
                 news_detail = self._find_news_detail_by_title(
-                    llm_title, news_title.source, deduplicated_data_source, title_info
+                    llm_title,
+                    news_title.source,
+                    deduplicated_data_source,
+                    title_info,
+                    self._source_to_pid,
                 )
 
+                first_time = news_detail.get("first_time", "")
+                last_time = news_detail.get("last_time", "")
+
                 title_data = {
                     "title": llm_title,  # 直接使用 LLM 输出的标题
                     "source_name": news_title.source,
-                    "first_time": news_detail.get("first_time", ""),
-                    "last_time": news_detail.get("last_time", ""),
-                    "time_display": format_time_display(
-                        news_detail.get("first_time", ""),
-                        news_detail.get("last_time", ""),
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    # 两个时间都为空时显示也必然为空，跳过格式化调用
+                    "time_display": (
+                        format_time_display(first_time, last_time)
+                        if first_time or last_time
+                        else ""
                     ),
                     "count": news_detail.get("count", 1),
                     "ranks": news_title.rank
                     if isinstance(news_title.rank, list)
                     else [news_title.rank],
-                    "rank_threshold": CONFIG["RANK_THRESHOLD"],
+                    "rank_threshold": rank_threshold,
                     "url": news_detail.get("url", ""),
                     "mobile_url": news_detail.get("mobile_url", ""),
                     "is_new": news_detail.get("is_new", False),
@@ -253,47 +360,54 @@ class LLMAnalyzer:
         return stats
 
     def _find_news_detail_by_title(
-        self, title: str, source: str, deduplicated_data_source: Dict, title_info: Dict
+        self,
+        title: str,
+        source: str,
+        deduplicated_data_source: Dict,
+        title_info: Dict,
+        source_to_pid: Dict[str, str],
     ) -> Dict:
         """根据标题和来源查找新闻的详细信息"""
-        # 根据source查找对应的platform_id
-        platform_id = None
-        for platform in CONFIG["PLATFORMS"]:
-            if platform.get("name") == source or platform["id"] == source:
-                platform_id = platform["id"]
-                break
-
+        # 根据source查找对应的platform_id（预构建的映射，O(1)）
+        platform_id = source_to_pid.get(source)
         if not platform_id:
             return {}
 
-        # 在去重后的数据中查找匹配的标题
-        if platform_id in deduplicated_data_source:
-            for stored_title, title_data in deduplicated_data_source[platform_id].items():
-                # 精确匹配或包含匹配
-                if title == stored_title or title in stored_title or stored_title in title:
-                    # 从title_info中获取完整的统计信息
-                    if (platform_id in title_info and
-                        stored_title in title_info[platform_id]):
-                        info = title_info[platform_id][stored_title]
-                        return {
-                            "first_time": info.get("first_time", ""),
-                            "last_time": info.get("last_time", ""),
-                            "count": info.get("count", 1),
-                            "url": info.get("url", title_data.get("url", "")),
-                            "mobile_url": info.get("mobileUrl", title_data.get("mobileUrl", "")),
-                            "is_new": False,
-                        }
-                    else:
-                        # 如果在title_info中找不到，使用基本信息
-                        ranks = title_data.get("ranks", [])
-                        return {
-                            "first_time": "",
-                            "last_time": "",
-                            "count": len(ranks) if ranks else 1,
-                            "url": title_data.get("url", ""),
-                            "mobile_url": title_data.get("mobileUrl", ""),
-                            "is_new": False,
-                        }
+        # 在去重后的数据中查找匹配的标题：精确匹配直接走字典查找，
+        # 未命中时才退回包含匹配的线性扫描
+        source_titles = deduplicated_data_source.get(platform_id)
+        if source_titles:
+            stored_title = title if title in source_titles else None
+            if stored_title is None:
+                for candidate in source_titles:
+                    if title in candidate or candidate in title:
+                        stored_title = candidate
+                        break
+
+            if stored_title is not None:
+                title_data = source_titles[stored_title]
+                # 从title_info中获取完整的统计信息
+                info = title_info.get(platform_id, {}).get(stored_title)
+                if info is not None:
+                    return {
+                        "first_time": info.get("first_time", ""),
+                        "last_time": info.get("last_time", ""),
+                        "count": info.get("count", 1),
+                        "url": info.get("url", title_data.get("url", "")),
+                        "mobile_url": info.get("mobileUrl", title_data.get("mobileUrl", "")),
+                        "is_new": False,
+                    }
+
+                # 如果在title_info中找不到，使用基本信息
+                ranks = title_data.get("ranks", [])
+                return {
+                    "first_time": "",
+                    "last_time": "",
+                    "count": len(ranks) if ranks else 1,
+                    "url": title_data.get("url", ""),
+                    "mobile_url": title_data.get("mobileUrl", ""),
+                    "is_new": False,
+                }
 
         # 如果找不到匹配的标题，返回默认值
         return {
@@ -307,12 +421,8 @@ class LLMAnalyzer:
 
     def _find_news_detail_from_title_info(self, rank: int, source: str, deduplicated_data_source: Dict, title_info: Dict) -> Dict:
         """从title_info中根据rank和source查找新闻的详细信息（使用去重后的数据）"""
-        # 根据source查找对应的platform_id
-        platform_id = None
-        for platform in CONFIG["PLATFORMS"]:
-            if platform.get("name") == source or platform["id"] == source:
-                platform_id = platform["id"]
-                break
+        # 根据source查找对应的platform_id（预构建的映射，O(1)）
+        platform_id = self._source_to_pid.get(source)
 
         if not platform_id or platform_id not in deduplicated_data_source:
             return {}
@@ -347,12 +457,8 @@ class LLMAnalyzer:
 
     def _find_news_detail(self, rank: int, source: str, data_source: Dict) -> Dict:
         """从data_source中根据rank查找新闻的详细信息"""
-        # 根据source查找对应的platform_id
-        platform_id = None
-        for platform in CONFIG["PLATFORMS"]:
-            if platform.get("name") == source or platform["id"] == source:
-                platform_id = platform["id"]
-                break
+        # 根据source查找对应的platform_id（预构建的映射，O(1)）
+        platform_id = self._source_to_pid.get(source)
 
         if not platform_id or platform_id not in data_source:
             return {}
@@ -402,16 +508,11 @@ class LLMAnalyzer:
         return html_file
 
     def _build_id_to_name_mapping(self, data_source: Dict) -> Dict:
-        """构建platform_id到name的映射"""
-        id_to_name = {}
-        for platform in CONFIG["PLATFORMS"]:
-            platform_id = platform["id"]
-            platform_name = platform.get("name", platform_id)
-            id_to_name[platform_id] = platform_name
-        return id_to_name
+        """构建platform_id到name的映射（预构建的查找表拷贝）"""
+        return dict(self._pid_to_name)
 
     def _deduplicate_data_source(self, data_source: Dict) -> Tuple[Dict, Dict]:
-        """对 data_source 进行去重处理，参考 process_source_data 逻辑"""
+        """对 data_source 进行去重处理，参考 read_all_today_titles 的合并逻辑"""
         deduplicated_results = {}
         title_info = {}
 
@@ -446,11 +547,8 @@ class LLMAnalyzer:
                     existing_url = existing_data.get("url", "")
                     existing_mobile_url = existing_data.get("mobileUrl", "")
 
-                    # 合并排名
-                    merged_ranks = existing_ranks.copy()
-                    for rank in ranks:
-                        if rank not in merged_ranks:
-                            merged_ranks.append(rank)
+                    # 合并排名：有序去重，O(k) 完成
+                    merged_ranks = list(dict.fromkeys([*existing_ranks, *ranks]))
 
                     # 更新去重结果
                     deduplicated_results[source_id][title] = {
@@ -491,37 +589,64 @@ class LLMAnalyzer:
 
         print(f"LLM处理：当前批次 {original_count} 条，历史数据 {deduplicated_count} 条")
 
-        # 准备LLM分析的新闻标题（使用去重后的数据）
+        # 准备LLM分析的新闻标题（使用去重后的数据）。
+        # 平台按 id 排序，保证跨运行的提示词前缀稳定，尽量命中服务端 prompt cache；
+        # 每个平台内的文章保持热榜顺序不动，排名语义不能破坏
+        # 控制提示词规模：每个平台只保留排名最靠前的 30 条。长尾标题对分组结果
+        # 贡献很小，但 token 按量计费且拉长 prefill 时延
+        max_articles_per_platform = 30
+
         news_titles: List[Dict[str, str | List[str]]] = []
-        for platform, articles in deduplicated_data_source.items():
-            platform_name = next(
-                (
-                    p.get("name", p["id"])
-                    for p in CONFIG["PLATFORMS"]
-                    if p["id"] == platform
-                ),
-                platform,
-            )
+        for platform, articles in sorted(deduplicated_data_source.items()):
+            platform_name = self._pid_to_name.get(platform, platform)
+
+            article_titles = list(articles.keys())
+            if len(article_titles) > max_articles_per_platform:
+                article_titles = sorted(
+                    article_titles,
+                    key=lambda t: min(articles[t].get("ranks") or [999]),
+                )[:max_articles_per_platform]
+
             news_titles.append(
                 {
                     "platform": platform_name,
-                    "articles": list(articles.keys()),
+                    "articles": article_titles,
                 }
             )
 
-        print(f"LLM 分析中，模型：{CONFIG['LLM_MODEL']}")
-        response = self.client.chat.completions.create(
-            model=CONFIG["LLM_MODEL"],
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": self._prepare_news_title(news_titles)},
-            ],
-            stream=False,
-            max_completion_tokens=8000
-        )
+        user_content = self._prepare_news_title(news_titles)
+
+        # 命中缓存时跳过整次 LLM 调用
+        cache_file = self._cache_file_for(user_content)
+        llm_summary = self._load_cached_response(cache_file)
+        if llm_summary is not None:
+            print("LLM 分析命中缓存，跳过调用")
+        else:
+            print(f"LLM 分析中，模型：{CONFIG['LLM_MODEL']}")
+            response = self.client.chat.completions.create(
+                model=CONFIG["LLM_MODEL"],
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": user_content},
+                ],
+                stream=True,
+                max_completion_tokens=8000
+            )
 
-        llm_summary = response.choices[0].message.content
-        print("LLM 分析完成")
+            # 流式接收：边解码边累积，首 token 到达即开始处理，
+            # 不必等服务端攒齐整个响应再一次性返回
+            chunks = []
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta and delta.content:
+                    chunks.append(delta.content)
+
+            llm_summary = "".join(chunks) if chunks else None
+            print("LLM 分析完成")
+            if llm_summary:
+                self._save_cached_response(cache_file, llm_summary)
 
         if llm_summary is None:
             print("LLM 返回的结果为空")
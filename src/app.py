@@ -1,5 +1,15 @@
+import logging
+import sys
+
 from analyzer.analyzer import NewsAnalyzer
 
+# 统一的日志输出：走缓冲的 stdout 流，消息级别常开、格式只含正文
+logging.basicConfig(
+    handlers=[logging.StreamHandler(sys.stdout)],
+    level=logging.INFO,
+    format="%(message)s",
+)
+
 def main():
     try:
         analyzer = NewsAnalyzer()
@@ -1,58 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from utils import get_output_path
 from utils.formatter import clean_title
 from utils.datetime import format_time_filename, format_date_folder
 import os
+import re
 from pathlib import Path
 
+# 标题行格式："<排名>. <标题> [URL:...] [MOBILE:...]"，排名和两个链接都可省略
+_TITLE_LINE_RE = re.compile(
+    r"^(?:(\d+)\. )?(.*?)(?: \[URL:([^\]]*)\])?(?: \[MOBILE:([^\]]*)\])?$"
+)
+
 
 # === 数据处理 ===
 def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
     """保存标题到文件"""
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        for id_value, title_data in results.items():
-            # id | name 或 id
-            name = id_to_name.get(id_value)
-            if name and name != id_value:
-                f.write(f"{id_value} | {name}\n")
+    # 先在内存中组装所有行，一次 writelines 落盘，减少小块 write 系统调用
+    lines = []
+    for id_value, title_data in results.items():
+        # id | name 或 id
+        name = id_to_name.get(id_value)
+        if name and name != id_value:
+            lines.append(f"{id_value} | {name}\n")
+        else:
+            lines.append(f"{id_value}\n")
+
+        # 按排名排序标题
+        sorted_titles = []
+        for title, info in title_data.items():
+            cleaned_title = clean_title(title)
+            if isinstance(info, dict):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
             else:
-                f.write(f"{id_value}\n")
-
-            # 按排名排序标题
-            sorted_titles = []
-            for title, info in title_data.items():
-                cleaned_title = clean_title(title)
-                if isinstance(info, dict):
-                    ranks = info.get("ranks", [])
-                    url = info.get("url", "")
-                    mobile_url = info.get("mobileUrl", "")
-                else:
-                    ranks = info if isinstance(info, list) else []
-                    url = ""
-                    mobile_url = ""
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
 
-                rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
+            rank = ranks[0] if ranks else 1
+            sorted_titles.append((rank, cleaned_title, url, mobile_url))
 
-            sorted_titles.sort(key=lambda x: x[0])
+        sorted_titles.sort(key=lambda x: x[0])
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+        for rank, cleaned_title, url, mobile_url in sorted_titles:
+            line = f"{rank}. {cleaned_title}"
 
-                if url:
-                    line += f" [URL:{url}]"
-                if mobile_url:
-                    line += f" [MOBILE:{mobile_url}]"
-                f.write(line + "\n")
+            if url:
+                line += f" [URL:{url}]"
+            if mobile_url:
+                line += f" [MOBILE:{mobile_url}]"
+            lines.append(line + "\n")
 
-            f.write("\n")
+        lines.append("\n")
 
-        if failed_ids:
-            f.write("==== 以下ID请求失败 ====\n")
-            for id_value in failed_ids:
-                f.write(f"{id_value}\n")
+    if failed_ids:
+        lines.append("==== 以下ID请求失败 ====\n")
+        for id_value in failed_ids:
+            lines.append(f"{id_value}\n")
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
 
     return file_path
 
@@ -122,75 +134,90 @@ def load_frequency_words(
 
 
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
+    """流式解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
     titles_by_id = {}
     id_to_name = {}
 
+    # 逐行状态机：空行分段，段首是 "id | name" 或 "id"，正文行是标题
+    pending_header: Optional[Tuple[str, str]] = None
+    current_source_id: Optional[str] = None
+    in_failed_section = False
+
     with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        sections = content.split("\n\n")
+        for line in f:
+            stripped = line.strip()
 
-        for section in sections:
-            if not section.strip() or "==== 以下ID请求失败 ====" in section:
+            if not stripped:
+                pending_header = None
+                current_source_id = None
+                in_failed_section = False
                 continue
 
-            lines = section.strip().split("\n")
-            if len(lines) < 2:
+            if in_failed_section:
                 continue
 
-            # id | name 或 id
-            header_line = lines[0].strip()
-            if " | " in header_line:
-                parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
-                name = parts[1].strip()
+            if current_source_id is None and pending_header is None:
+                # 段首行：失败ID列表标记 或 平台头
+                if "==== 以下ID请求失败 ====" in stripped:
+                    in_failed_section = True
+                    continue
+
+                # id | name 或 id
+                if " | " in stripped:
+                    parts = stripped.split(" | ", 1)
+                    pending_header = (parts[0].strip(), parts[1].strip())
+                else:
+                    pending_header = (stripped, stripped)
+                continue
+
+            if pending_header is not None:
+                # 读到第一条正文行才登记平台（只有头没有正文的段落仍然被跳过）
+                source_id, name = pending_header
                 id_to_name[source_id] = name
-            else:
-                source_id = header_line
-                id_to_name[source_id] = source_id
-
-            titles_by_id[source_id] = {}
-
-            for line in lines[1:]:
-                if line.strip():
-                    try:
-                        title_part = line.strip()
-                        rank = None
-
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
-                            rank = int(rank_str)
-
-                        # 提取 MOBILE URL
-                        mobile_url = ""
-                        if " [MOBILE:" in title_part:
-                            title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                            if mobile_part.endswith("]"):
-                                mobile_url = mobile_part[:-1]
-
-                        # 提取 URL
-                        url = ""
-                        if " [URL:" in title_part:
-                            title_part, url_part = title_part.rsplit(" [URL:", 1)
-                            if url_part.endswith("]"):
-                                url = url_part[:-1]
-
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
-
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
-
-                    except Exception as e:
-                        print(f"解析标题行出错: {line}, 错误: {e}")
+                titles_by_id[source_id] = {}
+                current_source_id = source_id
+                pending_header = None
+
+            try:
+                match = _TITLE_LINE_RE.match(stripped)
+                rank_str, title_part, url, mobile_url = match.groups()
+
+                title = clean_title(title_part.strip())
+                ranks = [int(rank_str)] if rank_str is not None else [1]
+
+                titles_by_id[current_source_id][title] = {
+                    "ranks": ranks,
+                    "url": url or "",
+                    "mobileUrl": mobile_url or "",
+                }
+
+            except Exception as e:
+                print(f"解析标题行出错: {stripped}, 错误: {e}")
 
     return titles_by_id, id_to_name
 
 
+@lru_cache(maxsize=256)
+def _parse_file_titles_at(path_str: str, mtime_ns: int) -> Tuple[Dict, Dict]:
+    """按 (路径, mtime) 缓存的解析结果；文件被重写后自动失效"""
+    return parse_file_titles(Path(path_str))
+
+
+def parse_file_titles_cached(file_path: Path) -> Tuple[Dict, Dict]:
+    """解析txt文件，同一文件在进程内只解析一次。
+
+    read_all_today_titles 和 detect_latest_new_titles 会遍历同一批文件；
+    返回浅拷贝，调用方对平台字典的改写不会污染缓存。
+    """
+    titles_by_id, id_to_name = _parse_file_titles_at(
+        str(file_path), file_path.stat().st_mtime_ns
+    )
+    return (
+        {source_id: dict(titles) for source_id, titles in titles_by_id.items()},
+        dict(id_to_name),
+    )
+
+
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
@@ -201,111 +228,78 @@ def read_all_today_titles(
     if not txt_dir.exists():
         return {}, {}, {}
 
-    all_results = {}
     final_id_to_name = {}
-    title_info = {}
 
     files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
 
-    for file_path in files:
-        time_info = file_path.stem
-
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
-
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
-
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
+    # 解析相互独立，放到线程池并行执行；合并必须按文件时间顺序，保持串行
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            parsed_files = list(executor.map(parse_file_titles_cached, files))
+    else:
+        parsed_files = [parse_file_titles_cached(f) for f in files]
 
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+    # 跨文件累积每个标题的出现记录（文件已按时间顺序排序）
+    accumulated: Dict[str, Dict[str, Dict]] = {}
 
-        final_id_to_name.update(file_id_to_name)
+    for file_path, (titles_by_id, file_id_to_name) in zip(files, parsed_files):
+        time_info = file_path.stem
 
         for source_id, title_data in titles_by_id.items():
-            process_source_data(
-                source_id, title_data, time_info, all_results, title_info
-            )
-
-    return all_results, final_id_to_name, title_info
-
+            if (
+                current_platform_ids is not None
+                and source_id not in current_platform_ids
+            ):
+                continue
 
-def process_source_data(
-    source_id: str,
-    title_data: Dict,
-    time_info: str,
-    all_results: Dict,
-    title_info: Dict,
-) -> None:
-    """处理来源数据，合并重复标题"""
-    if source_id not in all_results:
-        all_results[source_id] = title_data
+            if source_id in file_id_to_name:
+                final_id_to_name[source_id] = file_id_to_name[source_id]
+
+            source_acc = accumulated.setdefault(source_id, {})
+            for title, data in title_data.items():
+                entry = source_acc.get(title)
+                if entry is None:
+                    source_acc[title] = {
+                        "ranks": list(data.get("ranks", [])),
+                        "url": data.get("url", ""),
+                        "mobileUrl": data.get("mobileUrl", ""),
+                        "times": [time_info],
+                    }
+                else:
+                    entry["ranks"].extend(data.get("ranks", []))
+                    if not entry["url"]:
+                        entry["url"] = data.get("url", "")
+                    if not entry["mobileUrl"]:
+                        entry["mobileUrl"] = data.get("mobileUrl", "")
+                    entry["times"].append(time_info)
+
+    # 第二遍：统一物化结果，first/last_time/count 一次算出
+    all_results = {}
+    title_info = {}
 
-        if source_id not in title_info:
-            title_info[source_id] = {}
+    for source_id, titles in accumulated.items():
+        all_results[source_id] = {}
+        title_info[source_id] = {}
 
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
+        for title, entry in titles.items():
+            merged_ranks = list(dict.fromkeys(entry["ranks"]))
+            times = entry["times"]
 
+            all_results[source_id][title] = {
+                "ranks": merged_ranks,
+                "url": entry["url"],
+                "mobileUrl": entry["mobileUrl"],
+            }
             title_info[source_id][title] = {
-                "first_time": time_info,
-                "last_time": time_info,
-                "count": 1,
-                "ranks": ranks,
-                "url": url,
-                "mobileUrl": mobile_url,
+                "first_time": times[0],
+                "last_time": times[-1],
+                "count": len(times),
+                "ranks": merged_ranks,
+                "url": entry["url"],
+                "mobileUrl": entry["mobileUrl"],
             }
-    else:
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
 
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-            else:
-                existing_data = all_results[source_id][title]
-                existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
-
-                merged_ranks = existing_ranks.copy()
-                for rank in ranks:
-                    if rank not in merged_ranks:
-                        merged_ranks.append(rank)
-
-                all_results[source_id][title] = {
-                    "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
-                }
-
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
+    return all_results, final_id_to_name, title_info
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
     """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
@@ -315,13 +309,17 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
     if not txt_dir.exists():
         return {}
 
+    # 平台过滤用 frozenset，成员判断 O(1)
+    if current_platform_ids is not None:
+        current_platform_ids = frozenset(current_platform_ids)
+
     files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
     if len(files) < 2:
         return {}
 
     # 解析最新文件
     latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
+    latest_titles, _ = parse_file_titles_cached(latest_file)
 
     # 如果指定了当前平台列表，过滤最新文件数据
     if current_platform_ids is not None:
@@ -331,24 +329,24 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
                 filtered_latest_titles[source_id] = title_data
         latest_titles = filtered_latest_titles
 
-    # 汇总历史标题（按平台过滤）
+    # 汇总历史标题（按平台过滤）。这里只需要标题集合，
+    # 直接读缓存的解析结果且不做防护性拷贝（只取键，绝不改写）
     historical_titles = {}
     for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
+        historical_data, _ = _parse_file_titles_at(
+            str(file_path), file_path.stat().st_mtime_ns
+        )
 
         for source_id, titles_data in historical_data.items():
+            if (
+                current_platform_ids is not None
+                and source_id not in current_platform_ids
+            ):
+                continue
+
             if source_id not in historical_titles:
                 historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
+            historical_titles[source_id].update(titles_data.keys())
 
     # 找出新增标题
     new_titles = {}
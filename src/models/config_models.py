@@ -1,6 +1,8 @@
 """配置相关的 Pydantic 模型定义"""
 
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 import yaml
 from typing import Dict, List, Optional, Union, Any
@@ -22,18 +24,46 @@ class CrawlerConfig(BaseModel):
     DEFAULT_PROXY: str = Field("", description="默认代理地址")
 
 
+VALID_REPORT_MODES = frozenset({"daily", "incremental", "current", "llm_analysis"})
+
+
 class ReportConfig(BaseModel):
     """报告配置"""
-    REPORT_MODE: str = Field(..., description="报告模式", pattern="^(daily|incremental|current|llm_analysis)$")
+    REPORT_MODE: str = Field(..., description="报告模式")
     RANK_THRESHOLD: int = Field(5, description="排名高亮阈值", ge=1)
     SORT_BY_POSITION_FIRST: bool = Field(False, description="是否优先按配置位置排序")
     MAX_NEWS_PER_KEYWORD: int = Field(0, description="每个关键词最大显示数量", ge=0)
 
+    @field_validator("REPORT_MODE")
+    @classmethod
+    def validate_report_mode(cls, v):
+        """校验报告模式：集合成员检查替代逐字段编译的正则；
+        取值来自固定小词表，intern 后所有实例共享同一份字符串"""
+        if v not in VALID_REPORT_MODES:
+            raise ValueError(f"REPORT_MODE必须是以下值之一: {set(VALID_REPORT_MODES)}")
+        return sys.intern(v)
+
 
 class TimeRangeConfig(BaseModel):
     """时间范围配置"""
-    START: str = Field("08:00", description="开始时间", pattern="^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
-    END: str = Field("22:00", description="结束时间", pattern="^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
+    START: str = Field("08:00", description="开始时间")
+    END: str = Field("22:00", description="结束时间")
+
+    @field_validator("START", "END")
+    @classmethod
+    def validate_hhmm(cls, v):
+        """校验 HH:MM 格式（共享一个校验器，避免为两个字段各编译一份正则）"""
+        hour, sep, minute = v.partition(":")
+        if not (
+            sep
+            and hour.isdigit()
+            and minute.isdigit()
+            and len(minute) == 2
+            and 0 <= int(hour) <= 23
+            and 0 <= int(minute) <= 59
+        ):
+            raise ValueError(f"时间格式错误，应为 HH:MM: {v}")
+        return v
 
 
 class PushWindowConfig(BaseModel):
@@ -71,10 +101,12 @@ class WeightConfig(BaseModel):
         return self
 
 
-class PlatformConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PlatformConfig:
     """平台配置"""
-    id: str = Field(..., description="平台ID")
-    name: str = Field(..., description="平台名称")
+
+    id: str  # 平台ID
+    name: str  # 平台名称
 
 
 class LLMConfig(BaseModel):
@@ -102,74 +134,26 @@ class WebhookConfig(BaseModel):
     NTFY_TOKEN: str = Field("", description="ntfy访问令牌")
     BARK_URL: str = Field("", description="Bark推送URL")
 
-
-class TrendRadarConfig(BaseModel):
-    """TrendRadar完整配置模型"""
-    # 应用配置
-    VERSION_CHECK_URL: str
-    SHOW_VERSION_UPDATE: bool
-
-    # 爬虫配置
-    REQUEST_INTERVAL: int
-    ENABLE_CRAWLER: bool
-    ONLY_CRAWLER: bool
-    USE_PROXY: bool
-    DEFAULT_PROXY: str
-
-    # 报告配置
-    REPORT_MODE: str
-    RANK_THRESHOLD: int
-    SORT_BY_POSITION_FIRST: bool
-    MAX_NEWS_PER_KEYWORD: int
-
-    # 通知配置
-    ENABLE_NOTIFICATION: bool
-    MESSAGE_BATCH_SIZE: int
-    DINGTALK_BATCH_SIZE: int
-    FEISHU_BATCH_SIZE: int
-    BARK_BATCH_SIZE: int
-    BATCH_SEND_INTERVAL: int
-    FEISHU_MESSAGE_SEPARATOR: str
-    PUSH_WINDOW: Dict[str, Union[bool, Dict[str, str], int]]
-
-    # 权重配置
-    WEIGHT_CONFIG: Dict[str, float]
-
-    # 平台配置
-    PLATFORMS: List[Dict[str, str]]
-
-    # LLM配置
-    LLM_KEY: str
-    LLM_URL: str
-    LLM_MODEL: str
-
-    # Webhook配置
-    FEISHU_WEBHOOK_URL: str
-    DINGTALK_WEBHOOK_URL: str
-    WEWORK_WEBHOOK_URL: str
-    WEWORK_MSG_TYPE: str
-    TELEGRAM_BOT_TOKEN: str
-    TELEGRAM_CHAT_ID: str
-    EMAIL_FROM: str
-    EMAIL_PASSWORD: str
-    EMAIL_TO: str
-    EMAIL_SMTP_SERVER: str
-    EMAIL_SMTP_PORT: str
-    NTFY_SERVER_URL: str
-    NTFY_TOPIC: str
-    NTFY_TOKEN: str
-    BARK_URL: str
-
-    @field_validator('REPORT_MODE')
+    @field_validator("WEWORK_MSG_TYPE")
     @classmethod
-    def validate_report_mode(cls, v):
-        """验证报告模式"""
-        valid_modes = {"daily", "incremental", "current", "llm_analysis"}
-        if v not in valid_modes:
-            raise ValueError(f"REPORT_MODE必须是以下值之一: {valid_modes}")
-        return v
+    def intern_msg_type(cls, v):
+        """取值来自固定小词表，intern 后所有实例共享同一份字符串"""
+        return sys.intern(v) if isinstance(v, str) else v
+
 
-    @field_validator('PLATFORMS')
+class TrendRadarConfig(BaseModel):
+    """TrendRadar完整配置模型（按配置文件结构组合各子模型）"""
+
+    app: AppConfig
+    crawler: CrawlerConfig
+    report: ReportConfig
+    notification: NotificationConfig
+    weight: WeightConfig
+    platforms: List[Dict[str, str]]
+    llm: LLMConfig
+    webhook: WebhookConfig
+
+    @field_validator('platforms')
     @classmethod
     def validate_platforms(cls, v):
         """验证平台配置"""
@@ -180,47 +164,72 @@ class TrendRadarConfig(BaseModel):
                 raise ValueError("每个平台配置必须是字典类型")
             if 'id' not in platform or 'name' not in platform:
                 raise ValueError("每个平台配置必须包含'id'和'name'字段")
+            # 平台 id/name 被大量字典当作键引用，intern 让比较退化为指针比较
+            platform['id'] = sys.intern(platform['id'])
+            platform['name'] = sys.intern(platform['name'])
         return v
 
     model_config = {
         "extra": "forbid",  # 禁止额外字段
-        "validate_assignment": True,  # 赋值时验证
         "use_enum_values": True,  # 使用枚举值
     }
 
+    def model_post_init(self, __context: Any) -> None:
+        """构建一次平铺查找表，之后的字段访问都是一次字典探查
+
+        查找表直接写进实例 __dict__（而不是 Pydantic 私有属性），
+        __getitem__/get/__contains__ 里的 self._flat 走普通属性查找，
+        不经过 __getattr__ 派发。
+        """
+        flat: Dict[str, Any] = {}
+
+        for sub_model in (self.app, self.crawler, self.report, self.llm, self.webhook):
+            for field_name in type(sub_model).model_fields:
+                flat[field_name] = getattr(sub_model, field_name)
+
+        for field_name in NotificationConfig.model_fields:
+            value = getattr(self.notification, field_name)
+            # PUSH_WINDOW 等嵌套模型以普通字典形式暴露，保持旧接口
+            flat[field_name] = value.model_dump() if isinstance(value, BaseModel) else value
+
+        flat["WEIGHT_CONFIG"] = self.weight.model_dump()
+        flat["PLATFORMS"] = self.platforms
+
+        object.__setattr__(self, "_flat", flat)
+
+    def __getattr__(self, name: str) -> Any:
+        """兼容旧的平铺属性访问: CONFIG.REPORT_MODE 等"""
+        try:
+            return super().__getattr__(name)
+        except AttributeError:
+            flat = self.__dict__.get("_flat")
+            if flat and name in flat:
+                return flat[name]
+            raise
+
     def __getitem__(self, key: str) -> Any:
         """支持字典式访问: CONFIG["FIELD_NAME"]"""
-        if hasattr(self, key):
-            return getattr(self, key)
-        else:
-            raise KeyError(f"配置字段 '{key}' 不存在")
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        """支持字典式设置: CONFIG["FIELD_NAME"] = value"""
-        if hasattr(self, key):
-            setattr(self, key, value)
-        else:
-            raise KeyError(f"配置字段 '{key}' 不存在")
+        try:
+            return self._flat[key]
+        except KeyError:
+            raise KeyError(f"配置字段 '{key}' 不存在") from None
 
     def __contains__(self, key: str) -> bool:
         """支持 in 操作符: "FIELD_NAME" in CONFIG"""
-        return hasattr(self, key)
+        return key in self._flat
 
     def get(self, key: str, default: Any = None) -> Any:
         """支持 get 方法: CONFIG.get("FIELD_NAME", default_value)"""
-        if hasattr(self, key):
-            return getattr(self, key)
-        else:
-            return default
+        return self._flat.get(key, default)
 
     def keys(self):
         """支持 keys() 方法: CONFIG.keys()"""
-        return self.model_fields.keys()
+        return self._flat.keys()
 
     def values(self):
         """支持 values() 方法: CONFIG.values()"""
-        return [getattr(self, key) for key in self.model_fields.keys()]
+        return self._flat.values()
 
     def items(self):
         """支持 items() 方法: CONFIG.items()"""
-        return [(key, getattr(self, key)) for key in self.model_fields.keys()]
\ No newline at end of file
+        return self._flat.items()
\ No newline at end of file
@@ -1,18 +1,26 @@
-"""LLM 分析相关的 Pydantic 模型定义"""
+"""LLM 分析相关的数据模型定义
 
-from pydantic import BaseModel, Field
+纯记录类型用 dataclass(slots=True, frozen=True)：没有 Pydantic 实例簿记开销，
+属性访问是槽位读取。类型校验在摄入边界通过 TypeAdapter 完成。
+"""
+
+from dataclasses import dataclass
 from typing import List, Union
 
 
-class NewsTitle(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NewsTitle:
     """新闻标题模型"""
-    title: str = Field(description="新闻原标题")
-    rank: Union[int, List[int]] = Field(description="新闻在原热榜中的排序")  # 支持单个排名或排名列表
-    source: str = Field(description="新闻的来源平台")
+
+    title: str  # 新闻原标题
+    rank: Union[int, List[int]]  # 新闻在原热榜中的排序，支持单个排名或排名列表
+    source: str  # 新闻的来源平台
 
 
-class NewsGroup(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NewsGroup:
     """新闻分组模型"""
-    rank: int = Field(description="按照当前分组的新闻数量和热榜位置给出排名")
-    keywords: List[str] = Field(description="当前分组的新闻关键词，格式为字符串数组")
-    news_title: List[NewsTitle] = Field(description="当前分组的所有新闻标题")
\ No newline at end of file
+
+    rank: int  # 按照当前分组的新闻数量和热榜位置给出排名
+    keywords: List[str]  # 当前分组的新闻关键词
+    news_title: List[NewsTitle]  # 当前分组的所有新闻标题
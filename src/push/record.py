@@ -1,15 +1,39 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from utils import get_beijing_time, CONFIG
-import datetime
-import pytz
 import json
 
+
+@lru_cache(maxsize=16)
+def _parse_hhmm(time_str: str) -> "int | None":
+    """把 HH:MM 解析成自零点起的分钟数，格式非法返回 None"""
+    try:
+        hour_str, minute_str = time_str.strip().split(":")
+        hour = int(hour_str)
+        minute = int(minute_str)
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError(f"时间范围错误: {time_str}")
+        return hour * 60 + minute
+    except Exception as e:
+        print(f"时间格式化错误 '{time_str}': {e}")
+        return None
+
+
+@lru_cache(maxsize=2)
+def _record_file_for(record_dir: str, date_str: str) -> Path:
+    """按日期缓存记录文件路径，Path 组装每天只做一次"""
+    return Path(record_dir) / f"push_record_{date_str}.json"
+
+
 # === 推送记录管理 ===
 class PushRecordManager:
     """推送记录管理器"""
 
     def __init__(self):
         self.record_dir = Path("output") / ".push_records"
+        # 当天推送状态的内存缓存 (日期, 是否已推送)；记录文件只会被本进程改写
+        self._today_pushed_cache: "tuple[str, bool] | None" = None
         self.ensure_record_dir()
         self.cleanup_old_records()
 
@@ -20,20 +44,20 @@ class PushRecordManager:
     def get_today_record_file(self) -> Path:
         """获取今天的记录文件路径"""
         today = get_beijing_time().strftime("%Y%m%d")
-        return self.record_dir / f"push_record_{today}.json"
+        return _record_file_for(str(self.record_dir), today)
 
     def cleanup_old_records(self):
         """清理过期的推送记录"""
         retention_days = CONFIG["PUSH_WINDOW"]["RECORD_RETENTION_DAYS"]
-        current_time = get_beijing_time()
+        # 截止日期只算一次，循环内只做一次日期解析和比较，无需时区转换
+        cutoff_date = (get_beijing_time() - timedelta(days=retention_days)).date()
 
         for record_file in self.record_dir.glob("push_record_*.json"):
             try:
                 date_str = record_file.stem.replace("push_record_", "")
-                file_date = datetime.strptime(date_str, "%Y%m%d")
-                file_date = pytz.timezone("Asia/Shanghai").localize(file_date)
+                file_date = datetime.strptime(date_str, "%Y%m%d").date()
 
-                if (current_time - file_date).days > retention_days:
+                if file_date < cutoff_date:
                     record_file.unlink()
                     print(f"清理过期推送记录: {record_file.name}")
             except Exception as e:
@@ -41,18 +65,23 @@ class PushRecordManager:
 
     def has_pushed_today(self) -> bool:
         """检查今天是否已经推送过"""
-        record_file = self.get_today_record_file()
+        today = get_beijing_time().strftime("%Y%m%d")
+        if self._today_pushed_cache and self._today_pushed_cache[0] == today:
+            return self._today_pushed_cache[1]
 
-        if not record_file.exists():
-            return False
+        record_file = _record_file_for(str(self.record_dir), today)
 
-        try:
-            with open(record_file, "r", encoding="utf-8") as f:
-                record = json.load(f)
-            return record.get("pushed", False)
-        except Exception as e:
-            print(f"读取推送记录失败: {e}")
-            return False
+        pushed = False
+        if record_file.exists():
+            try:
+                with open(record_file, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                pushed = record.get("pushed", False)
+            except Exception as e:
+                print(f"读取推送记录失败: {e}")
+
+        self._today_pushed_cache = (today, pushed)
+        return pushed
 
     def record_push(self, report_type: str):
         """记录推送"""
@@ -68,42 +97,26 @@ class PushRecordManager:
         try:
             with open(record_file, "w", encoding="utf-8") as f:
                 json.dump(record, f, ensure_ascii=False, indent=2)
+            self._today_pushed_cache = (now.strftime("%Y%m%d"), True)
             print(f"推送记录已保存: {report_type} at {now.strftime('%H:%M:%S')}")
         except Exception as e:
             print(f"保存推送记录失败: {e}")
 
     def is_in_time_range(self, start_time: str, end_time: str) -> bool:
-        """检查当前时间是否在指定时间范围内"""
+        """检查当前时间是否在指定时间范围内（按分钟数整数比较）"""
         now = get_beijing_time()
-        current_time = now.strftime("%H:%M")
-
-        def normalize_time(time_str: str) -> str:
-            """将时间字符串标准化为 HH:MM 格式"""
-            try:
-                parts = time_str.strip().split(":")
-                if len(parts) != 2:
-                    raise ValueError(f"时间格式错误: {time_str}")
+        current_minute = now.hour * 60 + now.minute
 
-                hour = int(parts[0])
-                minute = int(parts[1])
-
-                if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                    raise ValueError(f"时间范围错误: {time_str}")
-
-                return f"{hour:02d}:{minute:02d}"
-            except Exception as e:
-                print(f"时间格式化错误 '{time_str}': {e}")
-                return time_str
-
-        normalized_start = normalize_time(start_time)
-        normalized_end = normalize_time(end_time)
-        normalized_current = normalize_time(current_time)
+        start_minute = _parse_hhmm(start_time)
+        end_minute = _parse_hhmm(end_time)
+        if start_minute is None or end_minute is None:
+            return False
 
-        result = normalized_start <= normalized_current <= normalized_end
+        result = start_minute <= current_minute <= end_minute
 
         if not result:
             print(
-                f"时间窗口判断：当前 {normalized_current}，窗口 {normalized_start}-{normalized_end}"
+                f"时间窗口判断：当前 {now.strftime('%H:%M')}，窗口 {start_time}-{end_time}"
             )
 
         return result
@@ -326,7 +326,7 @@ def render_html_content(
     update_info: Optional[Dict] = None,
 ) -> str:
     """渲染HTML内容"""
-    html = """
+    parts = ["""
     <!DOCTYPE html>
     <html>
     <head>
@@ -768,70 +768,70 @@ def render_html_content(
                 <div class="header-info">
                     <div class="info-item">
                         <span class="info-label">报告类型</span>
-                        <span class="info-value">"""
+                        <span class="info-value">"""]
 
     # 处理报告类型显示
     if is_daily_summary:
         if mode == "current":
-            html += "当前榜单"
+            parts.append("当前榜单")
         elif mode == "incremental":
-            html += "增量模式"
+            parts.append("增量模式")
         elif mode == "llm_analysis":
-            html += "LLM分析"
+            parts.append("LLM分析")
         else:
-            html += "当日汇总"
+            parts.append("当日汇总")
     else:
         if mode == "llm_analysis":
-            html += "LLM分析"
+            parts.append("LLM分析")
         else:
-            html += "实时分析"
+            parts.append("实时分析")
 
-    html += """</span>
+    parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
 
-    html += f"{total_titles} 条"
+    parts.append(f"{total_titles} 条")
 
     # 计算筛选后的热点新闻数量
     hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
 
-    html += """</span>
+    parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
 
-    html += f"{hot_news_count} 条"
+    parts.append(f"{hot_news_count} 条")
 
-    html += """</span>
+    parts.append("""</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
+                        <span class="info-value">""")
 
     now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
+    parts.append(now.strftime("%m-%d %H:%M"))
 
-    html += """</span>
+    parts.append("""</span>
                     </div>
                 </div>
             </div>
 
-            <div class="content">"""
+            <div class="content">""")
 
     # 处理失败ID错误信息
     if report_data["failed_ids"]:
-        html += """
+        parts.append("""
                 <div class="error-section">
                     <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
+                    <ul class="error-list">""")
         for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
+            parts.append(f'<li class="error-item">{html_escape(id_value)}</li>')
+        parts.append("""
                     </ul>
-                </div>"""
+                </div>""")
 
     # 处理主要统计数据
     if report_data["stats"]:
@@ -850,7 +850,7 @@ def render_html_content(
 
             escaped_word = html_escape(stat["word"])
 
-            html += f"""
+            parts.append(f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
@@ -858,19 +858,19 @@ def render_html_content(
                             <div class="word-count {count_class}">{count} 条</div>
                         </div>
                         <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
+                    </div>""")
 
             # 处理每个词组下的新闻标题，给每条新闻标上序号
             for j, title_data in enumerate(stat["titles"], 1):
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
 
-                html += f"""
+                parts.append(f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
                             <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>""")
 
                 # 处理排名显示
                 ranks = title_data.get("ranks", [])
@@ -892,7 +892,7 @@ def render_html_content(
                     else:
                         rank_text = f"{min_rank}-{max_rank}"
 
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                    parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
 
                 # 处理时间显示
                 time_display = title_data.get("time_display", "")
@@ -903,18 +903,16 @@ def render_html_content(
                         .replace("[", "")
                         .replace("]", "")
                     )
-                    html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
+                    parts.append(f'<span class="time-info">{html_escape(simplified_time)}</span>')
 
                 # 处理出现次数
                 count_info = title_data.get("count", 1)
                 if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
+                    parts.append(f'<span class="count-info">{count_info}次</span>')
 
-                html += """
+                parts.append("""
                             </div>
-                            <div class="news-title">"""
+                            <div class="news-title">""")
 
                 # 处理标题和链接
                 escaped_title = html_escape(title_data["title"])
@@ -922,31 +920,31 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    parts.append(escaped_title)
 
-                html += """
+                parts.append("""
                             </div>
                         </div>
-                    </div>"""
+                    </div>""")
 
-            html += """
-                </div>"""
+            parts.append("""
+                </div>""")
 
     # 处理新增新闻区域
     if report_data["new_titles"]:
-        html += f"""
+        parts.append(f"""
                 <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data["total_new_count"]} 条)</div>"""
+                    <div class="new-section-title">本次新增热点 (共 {report_data["total_new_count"]} 条)</div>""")
 
         for source_data in report_data["new_titles"]:
             escaped_source = html_escape(source_data["source_name"])
             titles_count = len(source_data["titles"])
 
-            html += f"""
+            parts.append(f"""
                     <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>""")
 
             # 为新增新闻也添加序号
             for idx, title_data in enumerate(source_data["titles"], 1):
@@ -968,12 +966,12 @@ def render_html_content(
                 else:
                     rank_text = "?"
 
-                html += f"""
+                parts.append(f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
                             <div class="new-item-content">
-                                <div class="new-item-title">"""
+                                <div class="new-item-title">""")
 
                 # 处理新增新闻的链接
                 escaped_title = html_escape(title_data["title"])
@@ -981,22 +979,22 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    parts.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    html += escaped_title
+                    parts.append(escaped_title)
 
-                html += """
+                parts.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            html += """
-                    </div>"""
+            parts.append("""
+                    </div>""")
 
-        html += """
-                </div>"""
+        parts.append("""
+                </div>""")
 
-    html += """
+    parts.append("""
             </div>
 
             <div class="footer">
@@ -1004,16 +1002,16 @@ def render_html_content(
                     由 <span class="project-name">TrendRadar</span> 生成 ·
                     <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
                         GitHub 开源项目
-                    </a>"""
+                    </a>""")
 
     if update_info:
-        html += f"""
+        parts.append(f"""
                     <br>
                     <span style="color: #ea580c; font-weight: 500;">
                         发现新版本 {update_info["remote_version"]}，当前版本 {update_info["current_version"]}
-                    </span>"""
+                    </span>""")
 
-    html += """
+    parts.append("""
                 </div>
             </div>
         </div>
@@ -1327,9 +1325,9 @@ def render_html_content(
         </script>
     </body>
     </html>
-    """
+    """)
 
-    return html
+    return "".join(parts)
 
 
 def render_feishu_content(
@@ -1337,6 +1335,7 @@ def render_feishu_content(
 ) -> str:
     """渲染飞书内容"""
     text_content = ""
+    feishu_separator = CONFIG["FEISHU_MESSAGE_SEPARATOR"]
 
     if report_data["stats"]:
         text_content += f"📊 **热点词汇统计**\n\n"
@@ -1366,7 +1365,7 @@ def render_feishu_content(
                 text_content += "\n"
 
         if i < len(report_data["stats"]) - 1:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+            text_content += f"\n{feishu_separator}\n\n"
 
     if not text_content:
         if mode == "incremental":
@@ -1379,7 +1378,7 @@ def render_feishu_content(
 
     if report_data["new_titles"]:
         if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+            text_content += f"\n{feishu_separator}\n\n"
 
         text_content += (
             f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
@@ -1402,7 +1401,7 @@ def render_feishu_content(
 
     if report_data["failed_ids"]:
         if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+            text_content += f"\n{feishu_separator}\n\n"
 
         text_content += "⚠️ **数据获取失败的平台：**\n\n"
         for i, id_value in enumerate(report_data["failed_ids"], 1):
@@ -1520,6 +1519,7 @@ def split_content_into_batches(
     mode: str = "daily",
 ) -> List[str]:
     """分批处理消息内容，确保词组标题+至少第一条新闻的完整性"""
+    feishu_separator = CONFIG["FEISHU_MESSAGE_SEPARATOR"]
     if max_bytes is None:
         if format_type == "dingtalk":
             max_bytes = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
@@ -1783,7 +1783,7 @@ def split_content_into_batches(
                 elif format_type == "ntfy":
                     separator = f"\n\n"
                 elif format_type == "feishu":
-                    separator = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+                    separator = f"\n{feishu_separator}\n\n"
                 elif format_type == "dingtalk":
                     separator = f"\n---\n\n"
 
@@ -1806,7 +1806,7 @@ def split_content_into_batches(
         elif format_type == "ntfy":
             new_header = f"\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
         elif format_type == "feishu":
-            new_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
+            new_header = f"\n{feishu_separator}\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
         elif format_type == "dingtalk":
             new_header = f"\n---\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
 
@@ -1934,7 +1934,7 @@ def split_content_into_batches(
         elif format_type == "ntfy":
             failed_header = f"\n\n⚠️ **数据获取失败的平台：**\n\n"
         elif format_type == "feishu":
-            failed_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n⚠️ **数据获取失败的平台：**\n\n"
+            failed_header = f"\n{feishu_separator}\n\n⚠️ **数据获取失败的平台：**\n\n"
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
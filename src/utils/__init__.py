@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Optional
+
 from .config import load_config
 from models import TrendRadarConfig
 from .datetime import get_beijing_time
@@ -6,5 +8,20 @@ from .path import ensure_directory_exists, get_output_path
 
 __all__ = ["get_beijing_time", "check_version_update", "ensure_directory_exists", "get_output_path"]
 
-CONFIG: TrendRadarConfig = load_config()
 VERSION: str = "3.3.0"
+
+# CONFIG 延迟到首次访问时才加载（PEP 562）：
+# 单纯 import utils 不再触发 YAML 解析和 Pydantic 校验
+_CONFIG: Optional[TrendRadarConfig] = None
+
+if TYPE_CHECKING:
+    CONFIG: TrendRadarConfig
+
+
+def __getattr__(name: str):
+    if name == "CONFIG":
+        global _CONFIG
+        if _CONFIG is None:
+            _CONFIG = load_config()
+        return _CONFIG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,105 @@
+import hashlib
+import json
 import os
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
 import yaml
 from typing import Dict, List, Optional, Union, Any
-from models import TrendRadarConfig
+from models import (
+    AppConfig,
+    CrawlerConfig,
+    LLMConfig,
+    ModeStrategy,
+    NotificationConfig,
+    ReportConfig,
+    TrendRadarConfig,
+    WebhookConfig,
+    WeightConfig,
+)
+
+# 优先使用 libyaml 的 C 加速加载器，未编译绑定时退回纯 Python 实现
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+# webhook 字段的覆盖表：(配置字段, 环境变量名, yaml键, 默认值)，环境变量优先
+_WEBHOOK_OVERLAY = (
+    ("FEISHU_WEBHOOK_URL", "FEISHU_WEBHOOK_URL", "feishu_url", ""),
+    ("DINGTALK_WEBHOOK_URL", "DINGTALK_WEBHOOK_URL", "dingtalk_url", ""),
+    ("WEWORK_WEBHOOK_URL", "WEWORK_WEBHOOK_URL", "wework_url", ""),
+    ("WEWORK_MSG_TYPE", "WEWORK_MSG_TYPE", "wework_msg_type", "markdown"),
+    ("TELEGRAM_BOT_TOKEN", "TELEGRAM_BOT_TOKEN", "telegram_bot_token", ""),
+    ("TELEGRAM_CHAT_ID", "TELEGRAM_CHAT_ID", "telegram_chat_id", ""),
+    # 邮件配置
+    ("EMAIL_FROM", "EMAIL_FROM", "email_from", ""),
+    ("EMAIL_PASSWORD", "EMAIL_PASSWORD", "email_password", ""),
+    ("EMAIL_TO", "EMAIL_TO", "email_to", ""),
+    ("EMAIL_SMTP_SERVER", "EMAIL_SMTP_SERVER", "email_smtp_server", ""),
+    ("EMAIL_SMTP_PORT", "EMAIL_SMTP_PORT", "email_smtp_port", ""),
+    # ntfy配置
+    ("NTFY_SERVER_URL", "NTFY_SERVER_URL", "ntfy_server_url", "https://ntfy.sh"),
+    ("NTFY_TOPIC", "NTFY_TOPIC", "ntfy_topic", ""),
+    ("NTFY_TOKEN", "NTFY_TOKEN", "ntfy_token", ""),
+    # Bark配置
+    ("BARK_URL", "BARK_URL", "bark_url", ""),
+)
+
+# load_config 读取的全部环境变量；任何一个变化都会使 JSON 缓存失效
+_ENV_KEYS = (
+    "REPORT_MODE",
+    "SORT_BY_POSITION_FIRST",
+    "MAX_NEWS_PER_KEYWORD",
+    "ENABLE_CRAWLER",
+    "ONLY_CRAWLER",
+    "ENABLE_NOTIFICATION",
+    "PUSH_WINDOW_ENABLED",
+    "PUSH_WINDOW_START",
+    "PUSH_WINDOW_END",
+    "PUSH_WINDOW_ONCE_PER_DAY",
+    "PUSH_WINDOW_RETENTION_DAYS",
+    "LLM_KEY",
+    "LLM_URL",
+    "LLM_MODEL",
+) + tuple(env_key for _, env_key, _, _ in _WEBHOOK_OVERLAY)
+
+
+def _env_fingerprint() -> str:
+    """对 load_config 读取的环境变量做指纹，用于缓存失效判断"""
+    digest = hashlib.blake2b(digest_size=16)
+    for key in _ENV_KEYS:
+        digest.update(key.encode("utf-8"))
+        digest.update(b"=")
+        digest.update(os.environ.get(key, "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _read_config_cache(cache_path: Path, header: Dict) -> Optional[Dict]:
+    """读取 JSON 配置缓存；头部（yaml mtime/size + 环境指纹）不匹配时返回 None"""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("header") == header:
+            return cached.get("config")
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_config_cache(cache_path: Path, header: Dict, config: Dict) -> None:
+    """原子写入 JSON 配置缓存，失败只影响下次启动速度，不影响本次运行"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(cache_path.parent), prefix=".config.cache."
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"header": header, "config": config}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"写入配置缓存失败: {e}")
 
 
 # === 配置管理 ===
@@ -13,196 +110,202 @@ def load_config() -> TrendRadarConfig:
     if not Path(config_path).exists():
         raise FileNotFoundError(f"配置文件 {config_path} 不存在")
 
+    # YAML 解析和配置字典构建的结果缓存为 JSON：
+    # yaml 未变、环境变量未变时直接 json.load，跳过整个解析+构建过程
+    stat = os.stat(config_path)
+    cache_path = Path(config_path).parent / ".config.cache.json"
+    cache_header = {
+        "schema": 2,  # 配置字典结构版本，结构调整时递增使旧缓存失效
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "env_hash": _env_fingerprint(),
+    }
+
+    cached_config = _read_config_cache(cache_path, cache_header)
+    if cached_config is not None:
+        print(f"配置缓存加载成功: {cache_path}")
+        return _construct_config(cached_config)
+
     with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=_YamlSafeLoader)
 
     print(f"配置文件加载成功: {config_path}")
 
-    # 构建配置
+    # 构建配置（按配置文件结构嵌套，与 TrendRadarConfig 的子模型一一对应）
     config = {
-        "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
-        "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
-        "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
-        "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
-        or config_data["report"]["mode"],
-        "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
-        "SORT_BY_POSITION_FIRST": os.environ.get("SORT_BY_POSITION_FIRST", "")
-        .strip()
-        .lower()
-        in ("true", "1")
-        if os.environ.get("SORT_BY_POSITION_FIRST", "").strip()
-        else config_data["report"].get("sort_by_position_first", False),
-        "MAX_NEWS_PER_KEYWORD": int(
-            os.environ.get("MAX_NEWS_PER_KEYWORD", "").strip() or "0"
-        )
-        or config_data["report"].get("max_news_per_keyword", 0),
-        "USE_PROXY": config_data["crawler"]["use_proxy"],
-        "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
-        "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
-        in ("true", "1")
-        if os.environ.get("ENABLE_CRAWLER", "").strip()
-        else config_data["crawler"]["enable_crawler"],
-        "ONLY_CRAWLER": os.environ.get("ONLY_CRAWLER", "").strip().lower()
-        in ("true", "1")
-        if os.environ.get("ONLY_CRAWLER", "").strip()
-        else config_data["crawler"]["only_crawler"],
-        "ENABLE_NOTIFICATION": os.environ.get("ENABLE_NOTIFICATION", "").strip().lower()
-        in ("true", "1")
-        if os.environ.get("ENABLE_NOTIFICATION", "").strip()
-        else config_data["notification"]["enable_notification"],
-        "MESSAGE_BATCH_SIZE": config_data["notification"]["message_batch_size"],
-        "DINGTALK_BATCH_SIZE": config_data["notification"].get(
-            "dingtalk_batch_size", 20000
-        ),
-        "FEISHU_BATCH_SIZE": config_data["notification"].get(
-            "feishu_batch_size", 29000
-        ),
-        "BARK_BATCH_SIZE": config_data["notification"].get("bark_batch_size", 3600),
-        "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
-        "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
-            "feishu_message_separator"
-        ],
-        "PUSH_WINDOW": {
-            "ENABLED": os.environ.get("PUSH_WINDOW_ENABLED", "").strip().lower()
+        "app": {
+            "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
+            "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
+        },
+        "crawler": {
+            "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+            "USE_PROXY": config_data["crawler"]["use_proxy"],
+            "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
+            "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
             in ("true", "1")
-            if os.environ.get("PUSH_WINDOW_ENABLED", "").strip()
-            else config_data["notification"]
-            .get("push_window", {})
-            .get("enabled", False),
-            "TIME_RANGE": {
-                "START": os.environ.get("PUSH_WINDOW_START", "").strip()
-                or config_data["notification"]
-                .get("push_window", {})
-                .get("time_range", {})
-                .get("start", "08:00"),
-                "END": os.environ.get("PUSH_WINDOW_END", "").strip()
-                or config_data["notification"]
-                .get("push_window", {})
-                .get("time_range", {})
-                .get("end", "22:00"),
-            },
-            "ONCE_PER_DAY": os.environ.get("PUSH_WINDOW_ONCE_PER_DAY", "")
+            if os.environ.get("ENABLE_CRAWLER", "").strip()
+            else config_data["crawler"]["enable_crawler"],
+            "ONLY_CRAWLER": os.environ.get("ONLY_CRAWLER", "").strip().lower()
+            in ("true", "1")
+            if os.environ.get("ONLY_CRAWLER", "").strip()
+            else config_data["crawler"]["only_crawler"],
+        },
+        "report": {
+            "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
+            or config_data["report"]["mode"],
+            "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
+            "SORT_BY_POSITION_FIRST": os.environ.get("SORT_BY_POSITION_FIRST", "")
             .strip()
             .lower()
             in ("true", "1")
-            if os.environ.get("PUSH_WINDOW_ONCE_PER_DAY", "").strip()
-            else config_data["notification"]
-            .get("push_window", {})
-            .get("once_per_day", True),
-            "RECORD_RETENTION_DAYS": int(
-                os.environ.get("PUSH_WINDOW_RETENTION_DAYS", "").strip() or "0"
+            if os.environ.get("SORT_BY_POSITION_FIRST", "").strip()
+            else config_data["report"].get("sort_by_position_first", False),
+            "MAX_NEWS_PER_KEYWORD": int(
+                os.environ.get("MAX_NEWS_PER_KEYWORD", "").strip() or "0"
             )
-            or config_data["notification"]
-            .get("push_window", {})
-            .get("push_record_retention_days", 7),
+            or config_data["report"].get("max_news_per_keyword", 0),
+        },
+        "notification": {
+            "ENABLE_NOTIFICATION": os.environ.get("ENABLE_NOTIFICATION", "")
+            .strip()
+            .lower()
+            in ("true", "1")
+            if os.environ.get("ENABLE_NOTIFICATION", "").strip()
+            else config_data["notification"]["enable_notification"],
+            "MESSAGE_BATCH_SIZE": config_data["notification"]["message_batch_size"],
+            "DINGTALK_BATCH_SIZE": config_data["notification"].get(
+                "dingtalk_batch_size", 20000
+            ),
+            "FEISHU_BATCH_SIZE": config_data["notification"].get(
+                "feishu_batch_size", 29000
+            ),
+            "BARK_BATCH_SIZE": config_data["notification"].get("bark_batch_size", 3600),
+            "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+            "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
+                "feishu_message_separator"
+            ],
+            "PUSH_WINDOW": {
+                "ENABLED": os.environ.get("PUSH_WINDOW_ENABLED", "").strip().lower()
+                in ("true", "1")
+                if os.environ.get("PUSH_WINDOW_ENABLED", "").strip()
+                else config_data["notification"]
+                .get("push_window", {})
+                .get("enabled", False),
+                "TIME_RANGE": {
+                    "START": os.environ.get("PUSH_WINDOW_START", "").strip()
+                    or config_data["notification"]
+                    .get("push_window", {})
+                    .get("time_range", {})
+                    .get("start", "08:00"),
+                    "END": os.environ.get("PUSH_WINDOW_END", "").strip()
+                    or config_data["notification"]
+                    .get("push_window", {})
+                    .get("time_range", {})
+                    .get("end", "22:00"),
+                },
+                "ONCE_PER_DAY": os.environ.get("PUSH_WINDOW_ONCE_PER_DAY", "")
+                .strip()
+                .lower()
+                in ("true", "1")
+                if os.environ.get("PUSH_WINDOW_ONCE_PER_DAY", "").strip()
+                else config_data["notification"]
+                .get("push_window", {})
+                .get("once_per_day", True),
+                "RECORD_RETENTION_DAYS": int(
+                    os.environ.get("PUSH_WINDOW_RETENTION_DAYS", "").strip() or "0"
+                )
+                or config_data["notification"]
+                .get("push_window", {})
+                .get("push_record_retention_days", 7),
+            },
         },
-        "WEIGHT_CONFIG": {
+        "weight": {
             "RANK_WEIGHT": config_data["weight"]["rank_weight"],
             "FREQUENCY_WEIGHT": config_data["weight"]["frequency_weight"],
             "HOTNESS_WEIGHT": config_data["weight"]["hotness_weight"],
         },
-        "PLATFORMS": config_data["platforms"],
-        "LLM_KEY": os.environ.get("LLM_KEY", "").strip()
-        or config_data.get("llm", {}).get("api_key", ""),
-        "LLM_URL": os.environ.get("LLM_URL", "").strip()
-        or config_data.get("llm", {}).get("base_url", ""),
-        "LLM_MODEL": os.environ.get("LLM_MODEL", "").strip()
-        or config_data.get("llm", {}).get("model", ""),
+        "platforms": config_data["platforms"],
+        "llm": {
+            "LLM_KEY": os.environ.get("LLM_KEY", "").strip()
+            or config_data.get("llm", {}).get("api_key", ""),
+            "LLM_URL": os.environ.get("LLM_URL", "").strip()
+            or config_data.get("llm", {}).get("base_url", ""),
+            "LLM_MODEL": os.environ.get("LLM_MODEL", "").strip()
+            or config_data.get("llm", {}).get("model", ""),
+        },
     }
 
     # 通知渠道配置（环境变量优先）
     notification = config_data.get("notification", {})
     webhooks = notification.get("webhooks", {})
 
-    config["FEISHU_WEBHOOK_URL"] = os.environ.get(
-        "FEISHU_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("feishu_url", "")
-    config["DINGTALK_WEBHOOK_URL"] = os.environ.get(
-        "DINGTALK_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("dingtalk_url", "")
-    config["WEWORK_WEBHOOK_URL"] = os.environ.get(
-        "WEWORK_WEBHOOK_URL", ""
-    ).strip() or webhooks.get("wework_url", "")
-    config["WEWORK_MSG_TYPE"] = os.environ.get(
-        "WEWORK_MSG_TYPE", ""
-    ).strip() or webhooks.get("wework_msg_type", "markdown")
-    config["TELEGRAM_BOT_TOKEN"] = os.environ.get(
-        "TELEGRAM_BOT_TOKEN", ""
-    ).strip() or webhooks.get("telegram_bot_token", "")
-    config["TELEGRAM_CHAT_ID"] = os.environ.get(
-        "TELEGRAM_CHAT_ID", ""
-    ).strip() or webhooks.get("telegram_chat_id", "")
-
-    # 邮件配置
-    config["EMAIL_FROM"] = os.environ.get("EMAIL_FROM", "").strip() or webhooks.get(
-        "email_from", ""
-    )
-    config["EMAIL_PASSWORD"] = os.environ.get(
-        "EMAIL_PASSWORD", ""
-    ).strip() or webhooks.get("email_password", "")
-    config["EMAIL_TO"] = os.environ.get("EMAIL_TO", "").strip() or webhooks.get(
-        "email_to", ""
-    )
-    config["EMAIL_SMTP_SERVER"] = os.environ.get(
-        "EMAIL_SMTP_SERVER", ""
-    ).strip() or webhooks.get("email_smtp_server", "")
-    config["EMAIL_SMTP_PORT"] = os.environ.get(
-        "EMAIL_SMTP_PORT", ""
-    ).strip() or webhooks.get("email_smtp_port", "")
-
-    # ntfy配置
-    config["NTFY_SERVER_URL"] = (
-        os.environ.get("NTFY_SERVER_URL", "").strip()
-        or webhooks.get("ntfy_server_url")
-        or "https://ntfy.sh"
-    )
-    config["NTFY_TOPIC"] = os.environ.get("NTFY_TOPIC", "").strip() or webhooks.get(
-        "ntfy_topic", ""
-    )
-    config["NTFY_TOKEN"] = os.environ.get("NTFY_TOKEN", "").strip() or webhooks.get(
-        "ntfy_token", ""
-    )
-
-    # Bark配置
-    config["BARK_URL"] = os.environ.get("BARK_URL", "").strip() or webhooks.get(
-        "bark_url", ""
-    )
+    webhook = {}
+    webhook_sources = {}
+    for field_name, env_key, yaml_key, default in _WEBHOOK_OVERLAY:
+        env_value = (os.environ.get(env_key) or "").strip()
+        if env_value:
+            webhook[field_name] = env_value
+            webhook_sources[field_name] = "环境变量"
+        else:
+            webhook[field_name] = webhooks.get(yaml_key) or default
+            webhook_sources[field_name] = "配置文件"
+    config["webhook"] = webhook
 
-    # 输出配置来源信息
+    # 输出配置来源信息（来源在覆盖阶段已记录，这里不再重查环境变量）
     notification_sources = []
-    if config["FEISHU_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("FEISHU_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"飞书({source})")
-    if config["DINGTALK_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("DINGTALK_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"钉钉({source})")
-    if config["WEWORK_WEBHOOK_URL"]:
-        source = "环境变量" if os.environ.get("WEWORK_WEBHOOK_URL") else "配置文件"
-        notification_sources.append(f"企业微信({source})")
-    if config["TELEGRAM_BOT_TOKEN"] and config["TELEGRAM_CHAT_ID"]:
-        token_source = (
-            "环境变量" if os.environ.get("TELEGRAM_BOT_TOKEN") else "配置文件"
+    if webhook["FEISHU_WEBHOOK_URL"]:
+        notification_sources.append(f"飞书({webhook_sources['FEISHU_WEBHOOK_URL']})")
+    if webhook["DINGTALK_WEBHOOK_URL"]:
+        notification_sources.append(f"钉钉({webhook_sources['DINGTALK_WEBHOOK_URL']})")
+    if webhook["WEWORK_WEBHOOK_URL"]:
+        notification_sources.append(f"企业微信({webhook_sources['WEWORK_WEBHOOK_URL']})")
+    if webhook["TELEGRAM_BOT_TOKEN"] and webhook["TELEGRAM_CHAT_ID"]:
+        notification_sources.append(
+            f"Telegram({webhook_sources['TELEGRAM_BOT_TOKEN']}/{webhook_sources['TELEGRAM_CHAT_ID']})"
         )
-        chat_source = "环境变量" if os.environ.get("TELEGRAM_CHAT_ID") else "配置文件"
-        notification_sources.append(f"Telegram({token_source}/{chat_source})")
-    if config["EMAIL_FROM"] and config["EMAIL_PASSWORD"] and config["EMAIL_TO"]:
-        from_source = "环境变量" if os.environ.get("EMAIL_FROM") else "配置文件"
-        notification_sources.append(f"邮件({from_source})")
+    if webhook["EMAIL_FROM"] and webhook["EMAIL_PASSWORD"] and webhook["EMAIL_TO"]:
+        notification_sources.append(f"邮件({webhook_sources['EMAIL_FROM']})")
 
-    if config["NTFY_SERVER_URL"] and config["NTFY_TOPIC"]:
-        server_source = "环境变量" if os.environ.get("NTFY_SERVER_URL") else "配置文件"
-        notification_sources.append(f"ntfy({server_source})")
+    if webhook["NTFY_SERVER_URL"] and webhook["NTFY_TOPIC"]:
+        notification_sources.append(f"ntfy({webhook_sources['NTFY_SERVER_URL']})")
 
-    if config["BARK_URL"]:
-        bark_source = "环境变量" if os.environ.get("BARK_URL") else "配置文件"
-        notification_sources.append(f"Bark({bark_source})")
+    if webhook["BARK_URL"]:
+        notification_sources.append(f"Bark({webhook_sources['BARK_URL']})")
 
     if notification_sources:
         print(f"通知渠道配置来源: {', '.join(notification_sources)}")
     else:
         print("未配置任何通知渠道")
 
-    # 使用 Pydantic 验证配置
+    validated_config = _validate_config(config)
+
+    # 只缓存校验成功且完成类型转换后的数据：
+    # 缓存命中路径用 model_construct 跳过校验，绝不能让未通过校验或未转换的字典进缓存
+    _write_config_cache(cache_path, cache_header, validated_config.model_dump())
+
+    return validated_config
+
+
+def _construct_config(config: Dict) -> TrendRadarConfig:
+    """从可信的缓存字典构建配置，用 model_construct 绕过重复校验。
+
+    缓存内容是上一次成功校验后的产物（头部保证 yaml 和环境变量都未变化），
+    再跑一遍字段校验纯属浪费；嵌套模型需要逐个构建，model_construct 不做类型转换。
+    """
+    return TrendRadarConfig.model_construct(
+        app=AppConfig.model_construct(**config["app"]),
+        crawler=CrawlerConfig.model_construct(**config["crawler"]),
+        report=ReportConfig.model_construct(**config["report"]),
+        notification=NotificationConfig.model_construct(**config["notification"]),
+        weight=WeightConfig.model_construct(**config["weight"]),
+        platforms=config["platforms"],
+        llm=LLMConfig.model_construct(**config["llm"]),
+        webhook=WebhookConfig.model_construct(**config["webhook"]),
+    )
+
+
+def _validate_config(config: Dict) -> TrendRadarConfig:
+    """使用 Pydantic 验证配置字典"""
     try:
         validated_config = TrendRadarConfig(**config)
         print("配置验证成功")
@@ -243,7 +346,7 @@ SMTP_CONFIGS = {
     "aliyun.com": {"server": "smtp.aliyun.com", "port": 465, "encryption": "TLS"},
 }
 
-MODE_STRATEGIES_CONFIG = {
+_MODE_STRATEGIES_RAW = {
     "incremental": {
         "mode_name": "增量模式",
         "description": "增量模式（只关注新增新闻，无新增时不推送）",
@@ -281,3 +384,12 @@ MODE_STRATEGIES_CONFIG = {
         "summary_mode": "llm_analysis",
     },
 }
+
+# 四个模式策略是常量：导入时用 model_construct（字面量可信，跳过校验）构建一次，
+# 以只读映射共享实例，避免每次分发重新构造/校验
+MODE_STRATEGIES_CONFIG = MappingProxyType(
+    {
+        mode: ModeStrategy.model_construct(**raw)
+        for mode, raw in _MODE_STRATEGIES_RAW.items()
+    }
+)
@@ -1,15 +1,23 @@
 import re
+from functools import lru_cache
 
-def clean_title(title: str) -> str:
-    """清理标题中的特殊字符"""
-    if not isinstance(title, str):
-        title = str(title)
+
+@lru_cache(maxsize=65536)
+def _clean_title_cached(title: str) -> str:
+    """清理标题的缓存实现：同一标题在多个文件/批次间反复出现，结果可复用"""
     cleaned_title = title.replace("\n", " ").replace("\r", " ")
     cleaned_title = re.sub(r"\s+", " ", cleaned_title)
     cleaned_title = cleaned_title.strip()
     return cleaned_title
 
 
+def clean_title(title: str) -> str:
+    """清理标题中的特殊字符"""
+    if not isinstance(title, str):
+        title = str(title)
+    return _clean_title_cached(title)
+
+
 def html_escape(text: str) -> str:
     """HTML转义"""
     if not isinstance(text, str):
@@ -1,33 +1,41 @@
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from functools import lru_cache
+import heapq
+from typing import Dict, List, Optional, Pattern, Tuple
 from utils import CONFIG
 from utils.datetime import is_first_crawl_today
+import re
 # === 统计和分析 ===
 def calculate_news_weight(
-    title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+    title_data: Dict,
+    rank_threshold: int = CONFIG["RANK_THRESHOLD"],
+    weight_config: Optional[Dict] = None,
 ) -> float:
-    """计算新闻权重，用于排序"""
+    """计算新闻权重，用于排序；weight_config 可由批量调用方绑定一次后传入"""
     ranks = title_data.get("ranks", [])
     if not ranks:
         return 0.0
 
     count = title_data.get("count", len(ranks))
-    weight_config = CONFIG["WEIGHT_CONFIG"]
+    if weight_config is None:
+        weight_config = CONFIG["WEIGHT_CONFIG"]
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
+    # 一次遍历同时累计排名得分和高排名次数
+    score_sum = 0
+    high_rank_count = 0
     for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        score_sum += 11 - min(rank, 10)
+        if rank <= rank_threshold:
+            high_rank_count += 1
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_weight = score_sum / len(ranks)
 
     # 频次权重：min(出现次数, 10) × 10
     frequency_weight = min(count, 10) * 10
 
     # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    hotness_weight = high_rank_count / len(ranks) * 100
 
     total_weight = (
         rank_weight * weight_config["RANK_WEIGHT"]
@@ -38,6 +46,39 @@ def calculate_news_weight(
     return total_weight
 
 
+@lru_cache(maxsize=8)
+def _compiled_matcher(
+    groups_key: Tuple, filter_key: Tuple[str, ...]
+) -> Tuple[List[Dict], Optional[Pattern], Optional[Pattern]]:
+    """按词表内容缓存编译好的匹配器（预处理词组 + 过滤词/词组词正则）"""
+    # 词序按选择性近似（词长）重排：必须词长词在前让 all() 尽早失败，
+    # 普通词短词在前让 any() 尽早命中；两者的判定结果与词序无关
+    prepared_groups = [
+        {
+            "group_key": group_key,
+            "required": tuple(
+                sorted((word.lower() for word in required), key=len, reverse=True)
+            ),
+            "normal": tuple(sorted((word.lower() for word in normal), key=len)),
+        }
+        for group_key, required, normal in groups_key
+    ]
+    filter_pattern = compile_filter_pattern([word.lower() for word in filter_key])
+    word_scanner = compile_word_scanner(prepared_groups)
+    return prepared_groups, filter_pattern, word_scanner
+
+
+def get_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> Tuple[List[Dict], Optional[Pattern], Optional[Pattern]]:
+    """获取（可能缓存的）编译匹配器；键由词表内容构成，配置不变时全程复用"""
+    groups_key = tuple(
+        (group["group_key"], tuple(group["required"]), tuple(group["normal"]))
+        for group in word_groups
+    )
+    return _compiled_matcher(groups_key, tuple(filter_words))
+
+
 def matches_word_groups(
     title: str, word_groups: List[Dict], filter_words: List[str]
 ) -> bool:
@@ -52,36 +93,67 @@ def matches_word_groups(
     if not word_groups:
         return True
 
-    title_lower = title.lower()
+    prepared_groups, filter_pattern, word_scanner = get_matcher(
+        word_groups, filter_words
+    )
+    return (
+        _find_matching_group(title.lower(), prepared_groups, filter_pattern, word_scanner)
+        is not None
+    )
 
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+def compile_word_scanner(prepared_groups: List[Dict]) -> Optional[Pattern]:
+    """把所有词组词合并编译成一个交替正则，每个标题只需一次 C 级扫描预筛"""
+    all_words = {
+        word
+        for group in prepared_groups
+        for word in group["required"] + group["normal"]
+    }
+    if not all_words:
+        return None
+    return re.compile("|".join(map(re.escape, sorted(all_words))))
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
 
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
+def compile_filter_pattern(filter_words: List[str]) -> Optional[Pattern]:
+    """把过滤词编译成单个交替正则，一次搜索替代逐词包含检查"""
+    if not filter_words:
+        return None
+    return re.compile("|".join(map(re.escape, sorted(filter_words))))
 
-        return True
 
-    return False
+def _find_matching_group(
+    title_lower: str,
+    prepared_groups: List[Dict],
+    filter_pattern: Optional[Pattern],
+    word_scanner: Optional[Pattern] = None,
+) -> Optional[int]:
+    """匹配内核：返回第一个匹配词组的下标，未匹配返回 None。
+
+    输入已统一小写，只做纯字符串包含检查。
+    """
+    if filter_pattern is not None and filter_pattern.search(title_lower) is not None:
+        return None
+
+    # 预筛：标题未命中任何词组词时，任何词组都不可能匹配，直接跳过逐组检查
+    if word_scanner is not None and word_scanner.search(title_lower) is None:
+        return None
+
+    for group_index, group in enumerate(prepared_groups):
+        required_words = group["required"]
+        if required_words and not all(
+            req_word in title_lower for req_word in required_words
+        ):
+            continue
+
+        normal_words = group["normal"]
+        if normal_words and not any(
+            normal_word in title_lower for normal_word in normal_words
+        ):
+            continue
+
+        return group_index
+
+    return None
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -94,6 +166,17 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
+# 各输出格式的排名高亮标记，模块级常量代替每次调用的 if/elif 阶梯
+_RANK_HIGHLIGHT_MARKERS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+}
+_DEFAULT_RANK_HIGHLIGHT = ("**", "**")
+
+
 def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
     """统一的排名格式化方法"""
     if not ranks:
@@ -103,24 +186,9 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
     min_rank = unique_ranks[0]
     max_rank = unique_ranks[-1]
 
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    else:
-        highlight_start = "**"
-        highlight_end = "**"
+    highlight_start, highlight_end = _RANK_HIGHLIGHT_MARKERS.get(
+        format_type, _DEFAULT_RANK_HIGHLIGHT
+    )
 
     if min_rank <= rank_threshold:
         if min_rank == max_rank:
@@ -167,27 +235,31 @@ def count_word_frequency(
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
         if title_info:
-            latest_time = None
-            for source_titles in title_info.values():
-                for title_data in source_titles.values():
-                    last_time = title_data.get("last_time", "")
-                    if last_time:
-                        if latest_time is None or last_time > latest_time:
-                            latest_time = last_time
+            # 单遍生成器求最新时间（HH时MM分 字典序即时间序）
+            latest_time = max(
+                (
+                    title_data.get("last_time", "")
+                    for source_titles in title_info.values()
+                    for title_data in source_titles.values()
+                ),
+                default="",
+            )
 
             # 只处理 last_time 等于最新时间的新闻
             if latest_time:
                 results_to_process = {}
                 for source_id, source_titles in results.items():
-                    if source_id in title_info:
-                        filtered_titles = {}
-                        for title, title_data in source_titles.items():
-                            if title in title_info[source_id]:
-                                info = title_info[source_id][title]
-                                if info.get("last_time") == latest_time:
-                                    filtered_titles[title] = title_data
-                        if filtered_titles:
-                            results_to_process[source_id] = filtered_titles
+                    info_for_source = title_info.get(source_id)
+                    if not info_for_source:
+                        continue
+
+                    filtered_titles = {}
+                    for title, title_data in source_titles.items():
+                        info = info_for_source.get(title)
+                        if info is not None and info.get("last_time") == latest_time:
+                            filtered_titles[title] = title_data
+                    if filtered_titles:
+                        results_to_process[source_id] = filtered_titles
 
                 print(
                     f"当前榜单模式：最新时间 {latest_time}，筛选出 {sum(len(titles) for titles in results_to_process.values())} 条当前榜单新闻"
@@ -209,9 +281,8 @@ def count_word_frequency(
         )
         print(f"当日汇总模式：处理 {total_input_news} 条新闻，模式：{filter_status}")
 
-    word_stats = {}
     total_titles = 0
-    processed_titles = {}
+    processed_titles = defaultdict(set)
     matched_new_count = 0
 
     if title_info is None:
@@ -219,27 +290,48 @@ def count_word_frequency(
     if new_titles is None:
         new_titles = {}
 
-    for group in word_groups:
-        group_key = group["group_key"]
-        word_stats[group_key] = {"count": 0, "titles": {}}
+    # 预处理词组和过滤词：小写转换和正则编译按词表内容缓存，配置不变时全程复用
+    prepared_groups, filter_pattern, word_scanner = get_matcher(
+        word_groups, filter_words
+    )
+    is_show_all = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+
+    # 按词组下标的数组计数器：内层命中只做一次列表索引 + defaultdict 探查
+    group_keys = [group["group_key"] for group in word_groups]
+    group_counts = [0] * len(group_keys)
+    group_titles = [defaultdict(list) for _ in group_keys]
 
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
+        # 来源级别的查找在源循环里做一次，不随标题重复
+        seen_titles = processed_titles[source_id]
+        source_name = id_to_name.get(source_id, source_id)
+        new_titles_for_source = new_titles.get(source_id) if new_titles else None
+        info_for_source = title_info.get(source_id) if title_info else None
 
         for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
+            if title in seen_titles:
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 防御性类型检查：确保 title 是有效字符串（小写转换只做一次）
+            title_str = title if isinstance(title, str) else str(title or "")
+            if not title_str.strip():
                 continue
+            title_lower = title_str.lower()
+
+            # 确定标题归属的词组
+            if is_show_all:
+                # "全部新闻"模式是循环不变的决策：过滤词已清空、唯一词组必然匹配，
+                # 直接归入该词组，完全跳过匹配内核
+                group_index = 0
+            else:
+                # 统一的匹配逻辑：内核单次扫描直接给出匹配的词组下标
+                group_index = _find_matching_group(
+                    title_lower, prepared_groups, filter_pattern, word_scanner
+                )
+                if group_index is None:
+                    continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
             if (mode == "incremental" and all_news_are_new) or (
@@ -247,143 +339,86 @@ def count_word_frequency(
             ):
                 matched_new_count += 1
 
+            group_counts[group_index] += 1
+
             source_ranks = title_data.get("ranks", [])
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = (
-                str(title).lower() if not isinstance(title, str) else title.lower()
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 从历史统计信息中获取完整数据（current 模式和当日汇总同样适用）
+            info = info_for_source.get(title) if info_for_source else None
+            if info is not None:
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if info.get("ranks"):
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            # 判断是否为新增：增量模式/当天第一次时全部新增，否则查本来源的新增集合
+            is_new = all_news_are_new or (
+                new_titles_for_source is not None and title in new_titles_for_source
             )
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            group_titles[group_index][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
+
+            seen_titles.add(title)
 
-                break
+    # 把数组计数器折叠回原有的 word_stats 结构（重复 group_key 归并到首个位置）
+    word_stats = {}
+    for index, group_key in enumerate(group_keys):
+        entry = word_stats.get(group_key)
+        if entry is None:
+            word_stats[group_key] = {
+                "count": group_counts[index],
+                "titles": group_titles[index],
+            }
+        else:
+            entry["count"] += group_counts[index]
+            for source_id, title_list in group_titles[index].items():
+                entry["titles"].setdefault(source_id, []).extend(title_list)
 
     # 最后统一打印汇总信息
     if mode == "incremental":
         if is_first_today:
-            total_input_news = sum(len(titles) for titles in results.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            # 第一次爬取时 results_to_process 即 results，总数已在主循环累计
+            total_input_news = total_titles
+            filter_status = "全部显示" if is_show_all else "频率词匹配"
+
             print(
                 f"增量模式：当天第一次爬取，{total_input_news} 条新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             if new_titles:
                 total_new_count = sum(len(titles) for titles in new_titles.values())
-                filter_status = (
-                    "全部显示"
-                    if len(word_groups) == 1
-                    and word_groups[0]["group_key"] == "全部新闻"
-                    else "匹配频率词"
-                )
+                filter_status = "全部显示" if is_show_all else "匹配频率词"
                 print(
                     f"增量模式：{total_new_count} 条新增新闻中，有 {matched_new_count} 条{filter_status}"
                 )
@@ -392,28 +427,25 @@ def count_word_frequency(
             else:
                 print("增量模式：未检测到新增新闻")
     elif mode == "current":
-        total_input_news = sum(len(titles) for titles in results_to_process.values())
+        # 主循环已按 results_to_process 累计过总数
+        total_input_news = total_titles
         if is_first_today:
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if is_show_all else "频率词匹配"
+
             print(
                 f"当前榜单模式：当天第一次爬取，{total_input_news} 条当前榜单新闻中有 {matched_new_count} 条{filter_status}"
             )
         else:
             matched_count = sum(stat["count"] for stat in word_stats.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if is_show_all else "频率词匹配"
             print(
                 f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
             )
 
     stats = []
+    # 循环不变的全局配置读取一次
+    default_max_count = CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
+    weight_config = CONFIG["WEIGHT_CONFIG"]
     # 创建 group_key 到位置和最大数量的映射
     group_key_to_position = {
         group["group_key"]: idx for idx, group in enumerate(word_groups)
@@ -427,24 +459,36 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
+        # 最大显示数量限制（优先级：单独配置 > 全局配置）
+        group_max_count = (
+            group_key_to_max_count.get(group_key, 0) or default_max_count
         )
 
-        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
-        group_max_count = group_key_to_max_count.get(group_key, 0)
-        if group_max_count == 0:
-            # 使用全局配置
-            group_max_count = CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
+        # 按权重排序：排序键只计算一次（装饰-排序-还原），
+        # 避免比较过程中对同一标题反复算权重
+        decorated = [
+            (
+                (
+                    -calculate_news_weight(title_data, rank_threshold, weight_config),
+                    min(title_data["ranks"]) if title_data["ranks"] else 999,
+                    -title_data["count"],
+                ),
+                index,
+                title_data,
+            )
+            for index, title_data in enumerate(all_titles)
+        ]
+
+        if 0 < group_max_count < len(decorated) // 4:
+            # top-K 远小于总量时用堆选择，免去整表排序；nsmallest 与 sorted 同样稳定
+            top_items = heapq.nsmallest(
+                group_max_count, decorated, key=lambda item: item[:2]
+            )
+        else:
+            decorated.sort(key=lambda item: item[:2])
+            top_items = decorated[:group_max_count] if group_max_count > 0 else decorated
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        sorted_titles = [title_data for _, _, title_data in top_items]
 
         stats.append(
             {
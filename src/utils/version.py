@@ -2,9 +2,12 @@ from typing import Tuple, Optional
 import requests
 
 def check_version_update(
-    current_version: str, version_url: str, proxy_url: Optional[str] = None
+    current_version: str,
+    version_url: str,
+    proxy_url: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> Tuple[bool, Optional[str]]:
-    """检查版本更新"""
+    """检查版本更新，可复用外部传入的连接池会话"""
     try:
         proxies = None
         if proxy_url:
@@ -16,7 +19,8 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
+        http = session if session is not None else requests
+        response = http.get(
             version_url, proxies=proxies, headers=headers, timeout=10
         )
         response.raise_for_status()